@@ -29,20 +29,24 @@ REGIME_TITLE = {
 # Helpers
 # =========================
 
-def parse_parts(name: str):
+def parse_parts(names: pd.Series) -> pd.DataFrame:
     """
     Expected format:
     osm_<regime>_<N>_<attr>
     where <regime> may contain underscores.
+
+    Vectorized: splits the whole column at once instead of per row.
     """
-    parts = name.split("_")
-    if parts[0] != "osm":
-        raise ValueError(f"Unexpected dataset name: {name}")
+    bad = ~names.str.startswith("osm_")
+    if bad.any():
+        raise ValueError(f"Unexpected dataset name: {names[bad].iloc[0]}")
 
-    attr = parts[-1]
-    N = int(parts[-2])
-    regime = "_".join(parts[1:-2])
-    return regime, N, attr
+    parts = names.str.rsplit("_", n=2, expand=True)
+    return pd.DataFrame({
+        "regime": parts[0].str.removeprefix("osm_"),
+        "N": parts[1].astype(int),
+        "attr": parts[2],
+    })
 
 # =========================
 # Load & prepare data
@@ -51,12 +55,11 @@ def parse_parts(name: str):
 df = pd.read_csv(CSV_PATH)
 
 # Parse dataset name
-df[["regime", "N", "attr"]] = df["dataset"].apply(
-    lambda s: pd.Series(parse_parts(s))
-)
+df[["regime", "N", "attr"]] = parse_parts(df["dataset"])
 
 # Enforce categorical ordering
 df["attr"] = pd.Categorical(df["attr"], categories=ATTR_ORDER, ordered=True)
+df["regime"] = df["regime"].astype("category")
 
 # Compute relative sizes (explicit, robust)
 for f in FORMATS:
@@ -65,6 +68,15 @@ for f in FORMATS:
 # Sort for plotting
 df = df.sort_values(["regime", "attr", "N"])
 
+# Group once; the plot loops below look rows up by group position
+# instead of re-scanning the whole frame with a boolean mask per panel.
+regime_idx = df.groupby("regime", observed=True, sort=False).indices
+panel_idx = df.groupby(["regime", "attr"], observed=True, sort=False).indices
+
+
+def rows(idx: dict, key) -> pd.DataFrame:
+    return df.iloc[idx.get(key, [])]
+
 # =========================
 # Plot A: Relative size vs N
 # =========================
@@ -73,8 +85,6 @@ df = df.sort_values(["regime", "attr", "N"])
 # =========================
 
 for regime in REGIMES:
-    sub = df[df["regime"] == regime]
-
     fig, axes = plt.subplots(2, 2, figsize=(12, 8), sharex=True, sharey=True)
     fig.suptitle(
         f"Relative representation size vs N — {REGIME_TITLE[regime]}",
@@ -82,7 +92,7 @@ for regime in REGIMES:
     )
 
     for ax, attr in zip(axes.flat, ATTR_ORDER):
-        s = sub[sub["attr"] == attr]
+        s = rows(panel_idx, (regime, attr))
 
         for f in FORMATS:
             ax.plot(
@@ -114,7 +124,7 @@ for regime in REGIMES:
 # =========================
 
 for regime in REGIMES:
-    sub = df[df["regime"] == regime]
+    sub = rows(regime_idx, regime)
     N_max = sub["N"].max()
     s = sub[sub["N"] == N_max].sort_values("attr")
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+# timing helpers shared by the benchmark scripts in this directory
+
+def sample_ns(
+    fn: Callable[[], Any], runs: int, warmup: int = 0, min_batch_ns: int = 1_000_000
+) -> np.ndarray:
+    """
+    Time fn() `runs` times and return the per-call time in ns of each sample.
+    fn() is first called `warmup` times untimed, right before its own samples, so
+    caches are hot for this operation and not for whichever ran last.
+    Calls shorter than min_batch_ns are timed in batches of `number` calls (sized
+    once from a probe call) and divided, so the two clock reads per sample do not
+    dominate sub-millisecond operations such as small file writes.
+    """
+    for _ in range(warmup):
+        fn()
+
+    now = time.perf_counter_ns
+    t0 = now()
+    fn()
+    probe = max(now() - t0, 1)
+    number = max(1, -(-min_batch_ns // probe))
+
+    # raw batch totals go into a preallocated int64 array (no list growth or
+    # float division inside the timed loop); per-call times are derived once after
+    batch = range(number)
+    totals = np.empty(runs, dtype=np.int64)
+    for i in range(runs):
+        t0 = now()
+        for _ in batch:
+            fn()
+        totals[i] = now() - t0
+    return totals / number
+
+def stats(samples_ns: np.ndarray) -> Dict[str, float]:
+    # one array, vectorised reductions (numpy comes with pandas from requirements.txt);
+    # std() is the population stdev, 0.0 for a single sample
+    ms = np.asarray(samples_ns, dtype=np.float64) / 1e6
+    return {
+        "n": int(ms.size),
+        "mean_ms": float(ms.mean()),
+        "median_ms": float(np.median(ms)),
+        "stdev_ms": float(ms.std()),
+        "min_ms": float(ms.min()),
+        "max_ms": float(ms.max()),
+    }
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-import json
+import os
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
+# optional: compressed GeoJSON size (JSON is normally zstd/gzip'ed at rest or on the wire)
+try:
+    import zstandard
+except ImportError:  # column is left empty without it
+    zstandard = None
+
 # sfproto
 from sfproto.geojson.v4.geojson import geojson_to_bytes_v4
 from sfproto.geojson.v7.geojson import geojson_to_bytes_v7
@@ -17,37 +25,51 @@ GeoJSON = Dict[str, Any]
 DATA_DIR = Path("data/benchmarks")
 FGB_DIR = Path("data/benchmarks_fgb_no_index")
 OUT_DIR = Path("bench/bench_out_osm/size")
-OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 SRID = 4326
 SCALE_V5 = 1000
+ZSTD_LEVEL = 3
 
 # =========================
 # Helpers
 # =========================
 
 def compact_geojson_bytes(obj: GeoJSON) -> bytes:
-    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    # orjson output is compact (no whitespace) utf-8 and equivalent JSON to
+    # json.dumps(separators=(",", ":"), ensure_ascii=False).encode(), but not always
+    # the same bytes: floats can be written shorter (1e16 vs 1e+16, 1e-7 vs 1e-07),
+    # and NaN/Infinity become null
+    return orjson.dumps(obj)
 
 # =========================
 # Benchmark
 # =========================
 
-print("=== Benchmark 01: Representation size ===\n")
-
-results = []
-
-for geojson_path in sorted(DATA_DIR.glob("*.geojson")):
+def _process_one(geojson_path: Path) -> Dict[str, Any]:
+    """
+    Size one dataset in all representations. Datasets are independent, so this
+    runs in a worker process; it only returns numbers and prints nothing.
+    """
     name = geojson_path.stem
     fgb_path = FGB_DIR / f"{name}.fgb"
 
     if not fgb_path.exists():
         raise FileNotFoundError(f"Missing FlatGeobuf file: {fgb_path}")
 
-    geojson_obj = json.loads(geojson_path.read_text(encoding="utf-8"))
+    # parsed in full on purpose: the v4/v7 encoders take a complete FeatureCollection
+    # (v7 delta-encodes every feature against one global start point), so a streaming
+    # parse would have to rebuild the same tree before encoding
+    geojson_obj = orjson.loads(geojson_path.read_bytes())
 
     # ---- GeoJSON ----
-    size_gj = len(compact_geojson_bytes(geojson_obj))
+    gj_bytes = compact_geojson_bytes(geojson_obj)
+    size_gj = len(gj_bytes)
+
+    # ---- GeoJSON + zstd ----
+    size_gj_zstd = (
+        len(zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(gj_bytes))
+        if zstandard is not None else None
+    )
 
     # ---- sfproto v4 ----
     size_v4 = len(geojson_to_bytes_v4(geojson_obj, srid=SRID))
@@ -64,28 +86,50 @@ for geojson_path in sorted(DATA_DIR.glob("*.geojson")):
     # ---- FlatGeobuf (reference) ----
     size_fgb = fgb_path.stat().st_size
 
-    print(name)
-    print(f"  GeoJSON: {size_gj:>12,} bytes")
-    print(f"  v4:      {size_v4:>12,} bytes  ({size_gj/size_v4:6.2f}× smaller)")
-    print(f"  v7:      {size_v7:>12,} bytes  ({size_gj/size_v7:6.2f}× smaller)")
-    print(f"  FGB:     {size_fgb:>12,} bytes  ({size_gj/size_fgb:6.2f}× smaller)")
-    print()
-
-    results.append(
-        {
-            "dataset": name,
-            "geojson": size_gj,
-            "v4": size_v4,
-            "v5": size_v7,
-            "fgb": size_fgb,
-        }
-    )
+    return {
+        "dataset": name,
+        "geojson": size_gj,
+        "geojson_zstd": size_gj_zstd,
+        "v4": size_v4,
+        "v5": size_v7,
+        "fgb": size_fgb,
+    }
 
-# Optional CSV
-summary = OUT_DIR / "size_summary.csv"
-with summary.open("w", encoding="utf-8") as f:
-    f.write("dataset,geojson,v4,v7,fgb\n")
-    for r in results:
-        f.write(f"{r['dataset']},{r['geojson']},{r['v4']},{r['v5']},{r['fgb']}\n")
 
-print(f"Summary written to {summary.resolve()}")
+def main() -> None:
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("=== Benchmark 01: Representation size ===\n")
+    if zstandard is None:
+        print("(zstandard not installed: GeoJSON+zstd column left empty)\n")
+
+    # one dataset per worker process; ex.map keeps the sorted order,
+    # so the report below is the same as a sequential run
+    paths = sorted(DATA_DIR.glob("*.geojson"))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = list(ex.map(_process_one, paths))
+
+    for r in results:
+        size_gj = r["geojson"]
+        print(r["dataset"])
+        print(f"  GeoJSON: {size_gj:>12,} bytes")
+        if r["geojson_zstd"] is not None:
+            print(f"  GJ+zstd: {r['geojson_zstd']:>12,} bytes  ({size_gj/r['geojson_zstd']:6.2f}× smaller)")
+        print(f"  v4:      {r['v4']:>12,} bytes  ({size_gj/r['v4']:6.2f}× smaller)")
+        print(f"  v7:      {r['v5']:>12,} bytes  ({size_gj/r['v5']:6.2f}× smaller)")
+        print(f"  FGB:     {r['fgb']:>12,} bytes  ({size_gj/r['fgb']:6.2f}× smaller)")
+        print()
+
+    # Optional CSV
+    summary = OUT_DIR / "size_summary.csv"
+    with summary.open("w", encoding="utf-8") as f:
+        f.write("dataset,geojson,geojson_zstd,v4,v7,fgb\n")
+        for r in results:
+            gj_zstd = "" if r["geojson_zstd"] is None else r["geojson_zstd"]
+            f.write(f"{r['dataset']},{r['geojson']},{gj_zstd},{r['v4']},{r['v5']},{r['fgb']}\n")
+
+    print(f"Summary written to {summary.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
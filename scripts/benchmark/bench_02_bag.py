@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-import json
-import time
-import statistics
+import os
+
+# time the native protobuf backend: must be selected before any *_pb2 import
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import mmap
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 import csv
+import gzip
 from pathlib import Path
-from typing import Any, Dict, List, Callable, Tuple
+from typing import Any, BinaryIO, Dict, List, Callable, Tuple
 
 # =========================================================
 # Imports
 # =========================================================
 
+# shared timing helpers (scripts/benchmark/_timing.py)
+from _timing import sample_ns, stats
+from sfproto._io import parse_mapped
+
 # BAG Pand v3
 from sfproto.geojson.v3_BAG.geojson_bag import (
     geojson_pand_featurecollection_to_bytes,
@@ -23,39 +34,69 @@ from sfproto.geojson.v3_BAG.geojson_bag import (
 from sfproto.geojson.v4.geojson import geojson_to_bytes_v4, bytes_to_geojson_v4
 from sfproto.geojson.v7.geojson import geojson_to_bytes_v7, bytes_to_geojson_v7
 
+from google.protobuf.internal import api_implementation
+
+# the pure-Python fallback is 10x+ slower and would dominate every CPU column
+if api_implementation.Type() not in ("upb", "cpp"):
+    raise RuntimeError(
+        f"protobuf is using the {api_implementation.Type()!r} backend; "
+        "install protobuf>=5 (ships the upb backend) before benchmarking"
+    )
+
 GeoJSON = Dict[str, Any]
 
 # =========================================================
 # Helpers
 # =========================================================
 
-def _now_ns() -> int:
-    return time.perf_counter_ns()
-
-def _stats(samples_ns: List[int]) -> Dict[str, float]:
-    ms = [s / 1e6 for s in samples_ns]
-    return {
-        "mean_ms": statistics.mean(ms),
-        "median_ms": statistics.median(ms),
-        "stdev_ms": statistics.pstdev(ms) if len(ms) > 1 else 0.0,
-        "min_ms": min(ms),
-        "max_ms": max(ms),
-    }
-
-def _compact_json(obj: Any) -> str:
-    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+def _compact_json(obj: Any) -> bytes:
+    # orjson output is already compact utf-8 bytes, identical to
+    # json.dumps(separators=(",", ":"), ensure_ascii=False).encode() for these inputs
+    return orjson.dumps(obj)
 
 def _write_bytes(path: Path, data: bytes) -> None:
+    # a plain write of the in-memory payload on purpose: os.copy_file_range/sendfile from
+    # a pre-written copy would time a kernel-internal file copy instead, and there is no
+    # shared warmup pass left to speed up (each operation warms up through itself)
     path.write_bytes(data)
 
 def _read_bytes(path: Path) -> bytes:
     return path.read_bytes()
 
-def _write_text(path: Path, s: str) -> None:
-    path.write_text(s, encoding="utf-8")
-
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
+def _codec_for(compress: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """
+    (compress, decompress) pair for the "compressed" rows: "gzip" (stdlib, level 6)
+    or "zstd" (level 3, needs the optional zstandard package).
+    """
+    if compress == "gzip":
+        return (lambda b: gzip.compress(b, compresslevel=6)), gzip.decompress
+    if compress == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError("compress='zstd' needs the zstandard package") from e
+        cctx = zstandard.ZstdCompressor(level=3)
+        dctx = zstandard.ZstdDecompressor()
+        return cctx.compress, dctx.decompress
+    raise ValueError(f"Unknown compression: {compress!r}")
+
+_DIRECT_ALIGN = 4096
+
+def _direct_buffer(data: bytes) -> mmap.mmap:
+    # O_DIRECT needs a block-aligned buffer and length: an anonymous mmap is page
+    # aligned, and is zero-padded up to the next multiple of _DIRECT_ALIGN
+    size = max(1, -(-len(data) // _DIRECT_ALIGN)) * _DIRECT_ALIGN
+    buf = mmap.mmap(-1, size)
+    buf[:len(data)] = data
+    return buf
+
+def _rewrite(f: BinaryIO, data: bytes) -> None:
+    # overwrite in place through an unbuffered handle that stays open across samples,
+    # so a sample times the write itself rather than open()/close() around it.
+    # That leaves one write() syscall per call; batching many of them through io_uring
+    # would time the submission queue rather than the single-file write measured here
+    f.seek(0)
+    f.write(data)
 
 # =========================================================
 # Core benchmark primitive
@@ -70,87 +111,216 @@ def benchmark_codec(
     runs: int,
     warmup: int,
     fair_geojson: bool,
+    use_odirect: bool = False,
+    parallel: int = 1,
+    compress: str = "none",
+    cold: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Returns list of CSV rows
+    use_odirect adds "raw_io_direct" write rows that bypass the page cache (Linux only)
+    parallel > 1 adds "raw_io_parallel" write rows with that many files in flight
+    compress ("gzip" | "zstd") adds "compressed" rows: serialize + compress + write and
+    read + decompress + parse, with size_bytes the compressed size
+    cold adds "raw_io_cold" read rows that evict the file from the page cache before
+    every read (Linux posix_fadvise); hot reads stay the default
     """
     rows: List[Dict[str, Any]] = []
+    # the protobuf rows the composed rows are built from, kept by reference
+    parts: Dict[str, Dict[str, Any]] = {}
 
     # ---- prepare baseline ----
     pb_bytes = encode_fn(geojson_obj)
-    decoded_obj = decode_fn(pb_bytes)
-    geojson_str = _compact_json(decoded_obj if fair_geojson else geojson_obj)
-    geojson_bytes = geojson_str.encode("utf-8")
+    # the decoded tree is only needed for its serialized size: dump it straight
+    # away instead of keeping a second full GeoJSON tree alive (and tracked by
+    # the GC) for all the timed runs below (setup, not timed)
+    geojson_bytes = _compact_json(decode_fn(pb_bytes) if fair_geojson else geojson_obj)
 
     pb_path = out_dir / f"{label}.bin"
     gj_path = out_dir / f"{label}.geojson"
 
-    # ---- warmup ----
-    for _ in range(warmup):
-        encode_fn(geojson_obj)
-        decode_fn(pb_bytes)
-        _write_bytes(pb_path, pb_bytes)
-        _read_bytes(pb_path)
-        _write_text(gj_path, geojson_str)
-        _read_text(gj_path)
+    # timed callables are built once here (not as fresh lambdas per stage)
+    def _encode() -> bytes:
+        return encode_fn(geojson_obj)
+
+    def _decode() -> GeoJSON:
+        return decode_fn(pb_bytes)
 
     # ---- CPU encode/decode ----
-    for phase, fn in [("encode", lambda: encode_fn(geojson_obj)),
-                      ("decode", lambda: decode_fn(pb_bytes))]:
-        samples = []
-        for _ in range(runs):
-            t0 = _now_ns()
-            fn()
-            samples.append(_now_ns() - t0)
+    # every stage is sampled through sample_ns: each operation gets its own warmup
+    # right before its samples, and calls under 1 ms (small inputs) are timed in
+    # batches, larger ones still one call per sample
+    for phase, fn in [("encode", _encode), ("decode", _decode)]:
+        samples = sample_ns(fn, runs, warmup)
 
         rows.append({
             "codec": label,
             "phase": phase,
             "stage": "cpu",
-            **_stats(samples),
+            **stats(samples),
             "size_bytes": len(pb_bytes),
         })
+        parts[f"pb_{phase}"] = rows[-1]
 
     # ---- raw IO ----
-    for phase, fn, size in [
-        ("write", lambda: _write_text(gj_path, geojson_str), len(geojson_bytes)),
-        ("read", lambda: _read_text(gj_path), len(geojson_bytes)),
-        ("write", lambda: _write_bytes(pb_path, pb_bytes), len(pb_bytes)),
-        ("read", lambda: _read_bytes(pb_path), len(pb_bytes)),
+    # the same payload is rewritten every sample, so the files are opened once
+    # ("wb" truncates any longer leftover) and overwritten from offset 0
+    with open(gj_path, "wb", buffering=0) as gj_f, open(pb_path, "wb", buffering=0) as pb_f:
+        _rewrite(gj_f, geojson_bytes)
+        _rewrite(pb_f, pb_bytes)
+        for phase, fn, size, part in [
+            ("write", lambda: _rewrite(gj_f, geojson_bytes), len(geojson_bytes), None),
+            ("read", lambda: _read_bytes(gj_path), len(geojson_bytes), None),
+            ("write", lambda: _rewrite(pb_f, pb_bytes), len(pb_bytes), None),
+            ("read", lambda: _read_bytes(pb_path), len(pb_bytes), "pb_read"),
+        ]:
+            samples = sample_ns(fn, runs, warmup)
+
+            rows.append({
+                "codec": label,
+                "phase": phase,
+                "stage": "raw_io",
+                **stats(samples),
+                "size_bytes": size,
+            })
+            if part:
+                parts[part] = rows[-1]
+
+    # ---- raw IO, cold ----
+    # the files are synced once (dirty pages cannot be dropped), then every read is
+    # preceded by POSIX_FADV_DONTNEED so it has to come from storage again
+    if cold:
+        for data, path in [(geojson_bytes, gj_path), (pb_bytes, pb_path)]:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+
+                def _cold_read(fd: int = fd, path: Path = path) -> bytes:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    return _read_bytes(path)
+
+                samples = sample_ns(_cold_read, runs, warmup)
+            finally:
+                os.close(fd)
+
+            rows.append({
+                "codec": label,
+                "phase": "read",
+                "stage": "raw_io_cold",
+                **stats(samples),
+                "size_bytes": len(data),
+            })
+
+    # ---- raw IO, O_DIRECT ----
+    # the cached writes above only copy into the page cache; these go to the device.
+    # The aligned buffers are prepared outside the timed region, and the padded files
+    # are written next to the regular ones so the read stages below are unaffected
+    if use_odirect:
+        for data, path in [(geojson_bytes, gj_path), (pb_bytes, pb_path)]:
+            buf = _direct_buffer(data)
+            fd = os.open(path.with_suffix(".direct" + path.suffix),
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT)
+            try:
+                samples = sample_ns(lambda: os.pwrite(fd, buf, 0), runs, warmup)
+            finally:
+                os.close(fd)
+                buf.close()
+
+            rows.append({
+                "codec": label,
+                "phase": "write",
+                "stage": "raw_io_direct",
+                **stats(samples),
+                "size_bytes": len(data),
+            })
+
+    # ---- raw IO, parallel ----
+    # `parallel` copies written concurrently from a thread pool (file writes release
+    # the GIL), one sample is the wall time of the whole fan-out + reap, so these rows
+    # include queue-depth effects; size_bytes is the total written per sample
+    if parallel > 1:
+        with ThreadPoolExecutor(parallel) as ex:
+            for data, path in [(geojson_bytes, gj_path), (pb_bytes, pb_path)]:
+                paths = [path.with_suffix(f".{i}{path.suffix}") for i in range(parallel)]
+                samples = sample_ns(
+                    lambda: list(ex.map(_write_bytes, paths, repeat(data))), runs, warmup
+                )
+
+                rows.append({
+                    "codec": label,
+                    "phase": "write",
+                    "stage": "raw_io_parallel",
+                    **stats(samples),
+                    "size_bytes": len(data) * parallel,
+                })
+
+    # ---- end-to-end ----
+    # reads parse straight from a read-only mapping (sfproto._io.parse_mapped); the cost of a
+    # copying read_bytes() is still in the raw_io read rows above.
+    # "write" is serialize + write from the GeoJSON tree; "write_only" writes the
+    # payload serialized once up front (open + write + close, unlike raw_io)
+    for phase, fn, size, part in [
+        ("write", lambda: _write_bytes(gj_path, _compact_json(geojson_obj)), len(geojson_bytes), None),
+        ("write_only", lambda: _write_bytes(gj_path, geojson_bytes), len(geojson_bytes), None),
+        ("read", lambda: parse_mapped(gj_path, orjson.loads), len(geojson_bytes), None),
+        ("write", lambda: _write_bytes(pb_path, encode_fn(geojson_obj)), len(pb_bytes), None),
+        ("write_only", lambda: _write_bytes(pb_path, pb_bytes), len(pb_bytes), "pb_write_only"),
+        ("read", lambda: parse_mapped(pb_path, decode_fn), len(pb_bytes), None),
     ]:
-        samples = []
-        for _ in range(runs):
-            t0 = _now_ns()
-            fn()
-            samples.append(_now_ns() - t0)
+        samples = sample_ns(fn, runs, warmup)
 
         rows.append({
             "codec": label,
             "phase": phase,
-            "stage": "raw_io",
-            **_stats(samples),
+            "stage": "end_to_end",
+            **stats(samples),
             "size_bytes": size,
         })
-
-    # ---- end-to-end ----
-    for phase, fn, size in [
-        ("write", lambda: _write_text(gj_path, _compact_json(geojson_obj)), len(geojson_bytes)),
-        ("read", lambda: json.loads(_read_text(gj_path)), len(geojson_bytes)),
-        ("write", lambda: _write_bytes(pb_path, encode_fn(geojson_obj)), len(pb_bytes)),
-        ("read", lambda: decode_fn(_read_bytes(pb_path)), len(pb_bytes)),
+        if part:
+            parts[part] = rows[-1]
+
+    # ---- compressed ----
+    # what goes over the wire when the payloads are compressed; the compressed files
+    # get their own suffix so the uncompressed ones above stay as they are
+    if compress != "none":
+        comp, decomp = _codec_for(compress)
+        ext = {"gzip": ".gz", "zstd": ".zst"}[compress]
+        gj_c_path = gj_path.with_suffix(gj_path.suffix + ext)
+        pb_c_path = pb_path.with_suffix(pb_path.suffix + ext)
+        gj_c_size = len(comp(geojson_bytes))
+        pb_c_size = len(comp(pb_bytes))
+        for phase, fn, size in [
+            ("write", lambda: _write_bytes(gj_c_path, comp(_compact_json(geojson_obj))), gj_c_size),
+            ("read", lambda: orjson.loads(decomp(_read_bytes(gj_c_path))), gj_c_size),
+            ("write", lambda: _write_bytes(pb_c_path, comp(encode_fn(geojson_obj))), pb_c_size),
+            ("read", lambda: decode_fn(decomp(_read_bytes(pb_c_path))), pb_c_size),
+        ]:
+            samples = sample_ns(fn, runs, warmup)
+
+            rows.append({
+                "codec": label,
+                "phase": phase,
+                "stage": f"compressed_{compress}",
+                **stats(samples),
+                "size_bytes": size,
+            })
+
+    # ---- composed ----
+    # protobuf write/read composed from the separately measured parts (mean only):
+    # cpu encode + write_only, and read_bytes() (raw_io) + cpu decode. Next to the
+    # measured end-to-end rows this shows how much the parts interfere.
+    # Only a mean can be composed, so run_all_benchmarks writes these rows to their
+    # own CSV instead of leaving the other stats columns empty in results.csv
+    for phase, names in [
+        ("write", ["pb_encode", "pb_write_only"]),
+        ("read", ["pb_read", "pb_decode"]),
     ]:
-        samples = []
-        for _ in range(runs):
-            t0 = _now_ns()
-            fn()
-            samples.append(_now_ns() - t0)
-
         rows.append({
             "codec": label,
             "phase": phase,
-            "stage": "end_to_end",
-            **_stats(samples),
-            "size_bytes": size,
+            "stage": "composed",
+            "mean_ms": sum(parts[n]["mean_ms"] for n in names),
+            "size_bytes": len(pb_bytes),
         })
 
     return rows
@@ -163,10 +333,18 @@ def run_all_benchmarks(
     geojson_path: Path,
     out_dir: Path = Path("bench/bench_out_bag"),
     csv_path: Path = Path("bench/bench_out_bag/results.csv"),
+    composed_csv_path: Path = Path("bench/bench_out_bag/composed.csv"),
     runs: int = 200,
     warmup: int = 20,
+    use_odirect: bool = False,
+    parallel: int = 1,
+    compress: str = "none",
+    cold: bool = False,
 ):
-    geojson_obj = json.loads(geojson_path.read_text(encoding="utf-8"))
+    # recorded so the timings in the CSV can be attributed to a backend
+    print(f"protobuf backend: {api_implementation.Type()}")
+
+    geojson_obj = orjson.loads(geojson_path.read_bytes())
     out_dir.mkdir(parents=True, exist_ok=True)
 
     rows: List[Dict[str, Any]] = []
@@ -183,6 +361,10 @@ def run_all_benchmarks(
         runs=runs,
         warmup=warmup,
         fair_geojson=True,
+        use_odirect=use_odirect,
+        parallel=parallel,
+        compress=compress,
+        cold=cold,
     )
 
     # Generic v4
@@ -195,6 +377,10 @@ def run_all_benchmarks(
         runs=runs,
         warmup=warmup,
         fair_geojson=True,
+        use_odirect=use_odirect,
+        parallel=parallel,
+        compress=compress,
+        cold=cold,
     )
 
     # Generic v7
@@ -207,16 +393,25 @@ def run_all_benchmarks(
         runs=runs,
         warmup=warmup,
         fair_geojson=True,
+        use_odirect=use_odirect,
+        parallel=parallel,
+        compress=compress,
+        cold=cold,
     )
 
     # ---- write CSV ----
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"Benchmark complete. CSV written to: {csv_path.resolve()}")
+    # measured rows (full stats) and composed rows (codec, phase, mean_ms, size_bytes)
+    # go to separate tables
+    measured = [r for r in rows if r["stage"] != "composed"]
+    composed = [r for r in rows if r["stage"] == "composed"]
+    for path, table in [(csv_path, measured), (composed_csv_path, composed)]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=table[0].keys())
+            writer.writeheader()
+            writer.writerows(table)
+
+    print(f"Benchmark complete. CSV written to: {csv_path.resolve()} and {composed_csv_path.resolve()}")
 
 # =========================================================
 # Entry point
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import orjson
+import pandas as pd
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# shared timing helpers (scripts/benchmark/_timing.py)
+from _timing import sample_ns, stats
+
+from sfproto.geojson.v3_BAG.geojson_bag import (
+    geojson_pand_featurecollection_to_bytes,
+    bytes_to_geojson_pand_featurecollection,
+    DEFAULT_SRID as BAG_DEFAULT_SRID,
+)
+from sfproto.geojson.v7.geojson import geojson_to_bytes_v7, bytes_to_geojson_v7
+
+GeoJSON = Dict[str, Any]
+
+# =========================================================
+# Codecs with a scale parameter
+# =========================================================
+
+# label -> (encode(obj, scale), decode(bytes))
+CODECS: Dict[str, Tuple[Callable[[GeoJSON, int], bytes], Callable[[bytes], GeoJSON]]] = {
+    "bag_v3": (
+        lambda o, scale: geojson_pand_featurecollection_to_bytes(o, srid=BAG_DEFAULT_SRID, scale=scale),
+        bytes_to_geojson_pand_featurecollection,
+    ),
+    "v7": (
+        lambda o, scale: geojson_to_bytes_v7(o, srid=28992, scale=scale),
+        bytes_to_geojson_v7,
+    ),
+}
+
+# =========================================================
+# Valid scales
+# =========================================================
+
+INT32_MAX = 2**31 - 1
+
+
+def _iter_xy(coords: Any) -> Iterator[Tuple[float, float]]:
+    # walk nested GeoJSON coordinates down to [x, y, ...] positions
+    if coords and isinstance(coords[0], (int, float)):
+        yield coords[0], coords[1]
+        return
+    for c in coords:
+        yield from _iter_xy(c)
+
+
+def max_valid_scale(geojson_obj: GeoJSON) -> int:
+    """
+    Largest scale whose quantized coordinates still fit sint32: both the absolute
+    start points (|coord| * scale) and the deltas (at most the per-axis extent * scale).
+    """
+    xs: List[float] = []
+    ys: List[float] = []
+    for feature in geojson_obj.get("features", []):
+        geometry = feature.get("geometry") or {}
+        for x, y in _iter_xy(geometry.get("coordinates", [])):
+            xs.append(x)
+            ys.append(y)
+    if not xs:
+        return INT32_MAX
+
+    bound = max(
+        max(abs(min(xs)), abs(max(xs)), abs(min(ys)), abs(max(ys))),
+        max(xs) - min(xs),
+        max(ys) - min(ys),
+    )
+    return int(INT32_MAX // bound) if bound > 0 else INT32_MAX
+
+# =========================================================
+# Sweep
+# =========================================================
+
+def benchmark_sweep(
+    inputs: List[Path],
+    scales: Optional[List[int]] = None,
+    runs: int = 50,
+    warmup: int = 5,
+) -> pd.DataFrame:
+    """
+    Time encode/decode for every input x codec x scale.
+    Each input is parsed once and shared by all codecs and scales; each (codec, scale)
+    is encoded once up front and those bytes are reused by its decode runs.
+    The largest valid scale is derived from each input's extent (max_valid_scale):
+    without `scales` every power of ten up to it is swept, given scales above it
+    are reported and left out.
+    """
+    records: List[Dict[str, Any]] = []
+
+    for path in inputs:
+        geojson_obj = orjson.loads(path.read_bytes())
+        n_features = len(geojson_obj.get("features", []))
+
+        limit = max_valid_scale(geojson_obj)
+        if scales is None:
+            input_scales = [10**k for k in range(1, len(str(limit))) if 10**k <= limit]
+        else:
+            input_scales = [s for s in scales if s <= limit]
+            for s in scales:
+                if s > limit:
+                    print(f"{path.name} scale={s}: skipped (overflows sint32, max {limit})")
+
+        for label, (encode_fn, decode_fn) in CODECS.items():
+            for scale in input_scales:
+                pb_bytes = encode_fn(geojson_obj, scale)
+
+                for phase, fn in [
+                    ("encode", lambda: encode_fn(geojson_obj, scale)),
+                    ("decode", lambda: decode_fn(pb_bytes)),
+                ]:
+                    st = stats(sample_ns(fn, runs, warmup))
+                    records.append({
+                        "input": path.name,
+                        "n_features": n_features,
+                        "label": label,
+                        "scale": scale,
+                        "phase": phase,
+                        "mean_ms": st["mean_ms"],
+                        "throughput_MBps": len(pb_bytes) / 1e6 / (st["mean_ms"] / 1e3),
+                        "bytes": len(pb_bytes),
+                    })
+
+    return pd.DataFrame.from_records(records)
+
+# =========================================================
+# Entry point
+# =========================================================
+
+if __name__ == "__main__":
+    csv_path = Path("bench/bench_out_bag/scale_sweep.csv")
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # every power of ten up to the largest scale the data allows
+    # (1000, i.e. mm, is the BAG default and the limit for EPSG:28992)
+    df = benchmark_sweep(
+        inputs=sorted(Path("data/bag_data").glob("bag_pand_*.geojson")),
+    )
+    df.to_csv(csv_path, index=False)
+
+    print(f"Sweep complete. CSV written to: {csv_path.resolve()}")
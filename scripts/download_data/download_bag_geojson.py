@@ -1,5 +1,5 @@
 import requests
-import json
+import orjson
 import os
 from typing import List, Dict, Any, Tuple
 
@@ -127,8 +127,8 @@ def download_bag_pand_by_bbox(
     }
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(feature_collection, f)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(feature_collection))
 
     print(f"Saved GeoJSON to {output_path}")
 
@@ -1,5 +1,7 @@
-import json
+import os
+import orjson
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # =============================
@@ -60,112 +62,143 @@ GEOMETRY_RATIOS = {
 }
 
 # =============================
-# Load input GeoJSON
+# Dataset writing (runs in worker processes)
 # =============================
 
-with open(INPUT_GEOJSON, "r", encoding="utf-8") as f:
-    data = json.load(f)
+def _build_and_write(size, regime, base_selection):
+    """
+    Write one dataset per attribute profile for a (size, regime) selection.
+    All profiles of a selection share one task, so base_selection is pickled
+    to a worker once instead of once per profile.
+    """
+    written = []
+
+    for attr_profile in ATTRIBUTE_PROFILES:
+        # look the schema callables up once per profile, not once per feature
+        extractors = [
+            (key, ATTRIBUTE_SCHEMA[key])
+            for key in ATTRIBUTE_PROFILE_MAP[attr_profile]
+        ]
+
+        out_features = [
+            {
+                "type": "Feature",
+                "geometry": f["geometry"],
+                "properties": {key: fn(f) for key, fn in extractors},
+            }
+            for f in base_selection
+        ]
+
+        out = {
+            "type": "FeatureCollection",
+            "features": out_features,
+        }
+
+        filename = (
+            f"osm_{regime}_{size}_{attr_profile}.geojson"
+        )
+        path = OUT_DIR / filename
+
+        with path.open("wb") as f:
+            f.write(orjson.dumps(out))
+
+        written.append(
+            f"Wrote {path.name} | "
+            f"size={size}, regime={regime}, attrs={attr_profile}"
+        )
+
+    return written
+
+
+if __name__ == "__main__":
+    # =============================
+    # Load input GeoJSON
+    # =============================
+
+    with open(INPUT_GEOJSON, "rb") as f:
+        data = orjson.loads(f.read())
 
-features = data["features"]
+    features = data["features"]
 
-# Deterministic ordering safeguard
-features.sort(
-    key=lambda f: (
-        f["geometry"]["type"],
-        f.get("id", "")
+    # Deterministic ordering safeguard
+    features.sort(
+        key=lambda f: (
+            f["geometry"]["type"],
+            f.get("id", "")
+        )
     )
-)
 
-# Group by geometry type
-by_geom = defaultdict(list)
-for f in features:
-    g = f["geometry"]["type"]
-    if g in ("Point", "LineString", "Polygon"):
-        by_geom[g].append(f)
+    # Group by geometry type
+    by_geom = defaultdict(list)
+    for f in features:
+        g = f["geometry"]["type"]
+        if g in ("Point", "LineString", "Polygon"):
+            by_geom[g].append(f)
 
-# =============================
-# Dataset construction
-# =============================
+    # =============================
+    # Dataset construction
+    # =============================
 
-OUT_DIR.mkdir(parents=True, exist_ok=True)
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-for size in SIZES:
-    for regime in GEOMETRY_REGIMES:
-        ratios = GEOMETRY_RATIOS[regime]
+    # every dataset is independent and orjson.dumps holds the GIL, so the
+    # writes go to worker processes; selection stays here and is cheap
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = []
 
-        # Determine counts per geometry
-        counts = {
-            g: int(size * ratios[g])
-            for g in ratios
-        }
+        for size in SIZES:
+            for regime in GEOMETRY_REGIMES:
+                ratios = GEOMETRY_RATIOS[regime]
 
-        # Fix rounding leftovers
-        while sum(counts.values()) < size:
-            counts["Point"] += 1
-
-        # Select features
-        base_selection = []
-        remaining = size
-
-        for g in ["Point", "LineString", "Polygon"]:
-            requested = counts.get(g, 0)
-            available = len(by_geom[g])
-
-            take = min(requested, available)
-            base_selection.extend(by_geom[g][:take])
-            remaining -= take
-
-        # Fill remainder deterministically
-        if remaining > 0:
-            for g in ["Point", "LineString", "Polygon"]:
-                extras = by_geom[g][counts.get(g, 0):]
-                take = min(len(extras), remaining)
-                base_selection.extend(extras[:take])
-                remaining -= take
-                if remaining == 0:
-                    break
-
-        if len(base_selection) != size:
-            raise RuntimeError(
-                f"Could only construct {len(base_selection)} features "
-                f"out of requested {size} (regime={regime})"
-            )
-
-
-        assert len(base_selection) == size
-
-        for attr_profile in ATTRIBUTE_PROFILES:
-            active_attrs = ATTRIBUTE_PROFILE_MAP[attr_profile]
-
-            out_features = []
-            for f in base_selection:
-                props = {
-                    key: ATTRIBUTE_SCHEMA[key](f)
-                    for key in active_attrs
+                # Determine counts per geometry
+                counts = {
+                    g: int(size * ratios[g])
+                    for g in ratios
                 }
 
-                out_features.append({
-                    "type": "Feature",
-                    "geometry": f["geometry"],
-                    "properties": props,
-                })
+                # Fix rounding leftovers
+                while sum(counts.values()) < size:
+                    counts["Point"] += 1
+
+                # Select features
+                base_selection = []
+                remaining = size
+
+                for g in ["Point", "LineString", "Polygon"]:
+                    requested = counts.get(g, 0)
+                    available = len(by_geom[g])
+
+                    take = min(requested, available)
+                    base_selection.extend(by_geom[g][:take])
+                    remaining -= take
+
+                # Fill remainder deterministically
+                if remaining > 0:
+                    for g in ["Point", "LineString", "Polygon"]:
+                        # slice only the features actually taken, not the whole tail
+                        start = counts.get(g, 0)
+                        take = max(0, min(len(by_geom[g]) - start, remaining))
+                        base_selection.extend(by_geom[g][start:start + take])
+                        remaining -= take
+                        if remaining == 0:
+                            break
+
+                if len(base_selection) != size:
+                    raise RuntimeError(
+                        f"Could only construct {len(base_selection)} features "
+                        f"out of requested {size} (regime={regime})"
+                    )
 
-            out = {
-                "type": "FeatureCollection",
-                "features": out_features,
-            }
 
-            filename = (
-                f"osm_{regime}_{size}_{attr_profile}.geojson"
-            )
-            path = OUT_DIR / filename
+                assert len(base_selection) == size
 
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(out, f, ensure_ascii=False)
+                futures.append(
+                    executor.submit(_build_and_write, size, regime, base_selection)
+                )
 
-            print(
-                f"Wrote {path.name} | "
-                f"size={size}, regime={regime}, attrs={attr_profile}"
-            )
+        # report in submission order; result() re-raises any worker error
+        for future in futures:
+            for line in future.result():
+                print(line)
 
-print("\nAll benchmark datasets generated.")
+    print("\nAll benchmark datasets generated.")
@@ -0,0 +1,21 @@
+import os
+import warnings
+
+# Ask for the upb backend before google.protobuf is first imported, so every
+# sfproto.sf.*_pb2 module is built on it. An explicit setting by the user wins,
+# and protobuf itself falls back (with a warning) if upb is not available.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from google.protobuf.internal import api_implementation
+
+# The codecs spend most of their time building/serializing messages; the
+# pure-Python protobuf runtime is an order of magnitude slower at that than
+# the native (upb, default since protobuf 4.21) or cpp backends.
+if api_implementation.Type() not in ("upb", "cpp"):
+    warnings.warn(
+        f"protobuf is using the {api_implementation.Type()!r} backend; "
+        "sfproto encoding/decoding will be slow. Install protobuf>=5 and unset "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION to use the upb backend.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import mmap
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+# file helpers shared by the CLI, the benchmark scripts and the example scripts
+
+
+def parse_mapped(path: Path, parse: Callable[[Any], Any]) -> Any:
+    """
+    Parse a file straight from a read-only memory map: parse() gets a memoryview
+    of the mapping (orjson and the protobuf decoders accept the buffer protocol),
+    so the file is not first copied into a bytes object.
+    Falls back to a plain read for files that cannot be mapped (e.g. empty files).
+    """
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return parse(f.read())
+        with mm, memoryview(mm) as buf:
+            return parse(buf)
+
+
+def write_mapped(path: Path, data: bytes) -> None:
+    """
+    Write data to a file through a shared memory map of its final size.
+    Empty payloads (which cannot be mapped) are written normally.
+    """
+    with path.open("w+b") as f:
+        if not data:
+            return
+        f.truncate(len(data))
+        with mmap.mmap(f.fileno(), len(data), access=mmap.ACCESS_WRITE) as mm:
+            mm[:] = data
+
+
+def write_stdout(data: bytes) -> None:
+    """
+    Write utf-8 encoded text to stdout in one write on the binary stream.
+    Text-only streams (notebooks, redirect_stdout(StringIO()), pytest capsys) have
+    no .buffer and get the decoded text instead.
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    # flush first so the bytes stay ordered after earlier print() output
+    sys.stdout.flush()
+    out.write(data)
@@ -3,17 +3,32 @@ import json
 from pathlib import Path
 import sys
 
+from sfproto._io import parse_mapped, write_mapped, write_stdout
 from sfproto.geojson.api import encode_geojson, decode_geojson
 
+# orjson parses/serializes in native code and works on bytes directly;
+# fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def read_json(path: Path):
+    if orjson is not None:
+        return parse_mapped(path, orjson.loads)
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def write_json(path: Path, obj):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
+    write_mapped(path, _dumps(obj))
 
 
 def read_bytes(path: Path) -> bytes:
@@ -21,7 +36,7 @@ def read_bytes(path: Path) -> bytes:
 
 
 def write_bytes(path: Path, data: bytes):
-    path.write_bytes(data)
+    write_mapped(path, data)
 
 
 def cmd_encode(args):
@@ -35,13 +50,12 @@ def cmd_encode(args):
 
 
 def cmd_decode(args):
-    data = read_bytes(args.input)
-    geojson = decode_geojson(data, delta=args.delta)
+    geojson = parse_mapped(args.input, lambda data: decode_geojson(data, delta=args.delta))
 
     if args.output:
         write_json(args.output, geojson)
     else:
-        json.dump(geojson, sys.stdout, indent=2)
+        write_stdout(_dumps(geojson))
 
 
 def main():
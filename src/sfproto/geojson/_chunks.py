@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import struct
+from typing import List
+
+# chunked payload of the tagged envelopes (v1, v2, v4-v7):
+# u32 count, then repeated (u32 len, bytes), all big-endian
+
+_U32 = struct.Struct(">I")
+
+
+def pack_chunks(chunks: List[bytes]) -> bytes:
+    parts = [_U32.pack(len(chunks))]
+    for c in chunks:
+        parts.append(_U32.pack(len(c)))
+        parts.append(c)
+    return b"".join(parts)
+
+
+def unpack_chunks(payload: bytes) -> List[bytes]:
+    mv = memoryview(payload)
+    if len(mv) < 4:
+        raise ValueError("Invalid chunk payload: too short")
+    (n,) = _U32.unpack_from(mv, 0)
+    offset = 4
+    chunks: List[bytes] = []
+    for _ in range(n):
+        if offset + 4 > len(mv):
+            raise ValueError("Invalid chunk payload: truncated length")
+        (ln,) = _U32.unpack_from(mv, offset)
+        offset += 4
+        if offset + ln > len(mv):
+            raise ValueError("Invalid chunk payload: truncated chunk")
+        chunks.append(bytes(mv[offset:offset + ln]))
+        offset += ln
+    if offset != len(mv):
+        raise ValueError("Invalid chunk payload: trailing bytes")
+    return chunks
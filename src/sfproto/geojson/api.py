@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Any, Union
 from pyproj import CRS
 
@@ -35,6 +36,9 @@ def extract_srid(geojson: GeoJSON) -> int:
         return DEFAULT_SRID
 
 
+# EPSG -> scale is fixed, and CRS.from_epsg goes to PROJ's database each call,
+# so batched encode_geojson(delta=True) calls share one lookup per srid
+@lru_cache(maxsize=64)
 def get_scaler(srid: int) -> int:
     crs = CRS.from_epsg(srid)
 
@@ -58,6 +62,9 @@ def encode_geojson(
 ) -> bytes:
     srid = extract_srid(geojson)
 
+    # the default stays lossless: v4 keeps the input doubles as they are. delta=True
+    # selects v7, which is the quantized + delta + zig-zag (sint32) version of the same
+    # data, trading precision beyond the CRS scaler for a much smaller payload
     if delta:
         scale = get_scaler(srid)
         return geojson_to_bytes_v7(geojson, srid=srid, scale=scale)
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Union
-from sfproto.geojson.v1.geojson_point import geojson_point_to_bytes, bytes_to_geojson_point
-from sfproto.geojson.v1.geojson_polygon import geojson_polygon_to_bytes, bytes_to_geojson_polygon
-from sfproto.geojson.v1.geojson_multipolygon import geojson_multipolygon_to_bytes, bytes_to_geojson_multipolygon
-from sfproto.geojson.v1.geojson_multipoint import geojson_multipoint_to_bytes, bytes_to_geojson_multipoint
-from sfproto.geojson.v1.geojson_linestring import geojson_linestring_to_bytes, bytes_to_geojson_linestring
-from sfproto.geojson.v1.geojson_multilinestring import geojson_multilinestring_to_bytes, bytes_to_geojson_multilinestring
-from sfproto.geojson.v1.geojson_geometrycollection import geojson_geometrycollection_to_bytes, bytes_to_geojson_geometrycollection
+from typing import Any, Callable, Dict, Union
+from sfproto.geojson.v1.geojson_geometry import GEOM_TO_BYTES
+from sfproto.geojson.v1.geojson_geometrycollection import (
+    geojson_geometrycollection_to_bytes,
+    bytes_to_geojson_geometrycollection,
+    bytes_to_geojson_geometry,
+)
 
 GeoJSON = Dict[str, Any]
 
+# GeoJSON geometry type -> encoder (a Feature may also carry a GeometryCollection)
+_GEOM_TO_BYTES: Dict[str, Callable[..., bytes]] = {
+    **GEOM_TO_BYTES,
+    "GeometryCollection": geojson_geometrycollection_to_bytes,
+}
+
+
 def geojson_feature_to_bytes(
     obj_or_json: Union[GeoJSON, str], srid: int = 0
 ) -> bytes:
@@ -38,29 +44,10 @@ def geojson_feature_to_bytes(
 
     gtype = geometry.get("type")
 
-    # get the geoemtry type and use the correct function for that type
-    if gtype == "Point":
-        return geojson_point_to_bytes(geometry, srid=srid)
-
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes(geometry, srid=srid)
-
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes(geometry, srid=srid)
-
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes(geometry, srid=srid)
-
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes(geometry, srid=srid)
-
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes(geometry, srid=srid)
-
-    if gtype == "GeometryCollection":
-        return geojson_geometrycollection_to_bytes(geometry, srid=srid)
-
-    raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    to_bytes = _GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid)
 
 
 def bytes_to_geojson_feature(data: bytes) -> GeoJSON:
@@ -68,26 +55,16 @@ def bytes_to_geojson_feature(data: bytes) -> GeoJSON:
     Convert Protobuf Geometry bytes -> GeoJSON Feature.
     Properties are always null.
     """
-    # Try each geometry decoder
-    for decoder in (
-        bytes_to_geojson_point,
-        bytes_to_geojson_multipoint,
-        bytes_to_geojson_polygon,
-        bytes_to_geojson_multipolygon,
-        bytes_to_geojson_linestring,
-        bytes_to_geojson_multilinestring,
-        bytes_to_geojson_geometrycollection,
-    ):
-        try:
-            # try the geoemtry decoder function, the function with the same geometry type should then work
-            geometry = decoder(data)
-            # output geojson Feature format
-            return {
-                "type": "Feature",
-                "geometry": geometry,
-                "properties": None, # to make a valid geojson, properties are added, but set to 'None'
-            }
-        except Exception:
-            pass
-
-    raise ValueError("Bytes do not contain a supported Geometry")
\ No newline at end of file
+    # a GeometryCollection feature is encoded as a list of geometry bytes; anything else
+    # is parsed once and dispatched on its oneof case (instead of trying every decoder)
+    if isinstance(data, list):
+        geometry = bytes_to_geojson_geometrycollection(data)
+    else:
+        geometry = bytes_to_geojson_geometry(data)
+
+    # output geojson Feature format
+    return {
+        "type": "Feature",
+        "geometry": geometry,
+        "properties": None, # to make a valid geojson, properties are added, but set to 'None'
+    }
\ No newline at end of file
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Union
-from sfproto.geojson.v1.geojson_feature import geojson_feature_to_bytes, bytes_to_geojson_feature
+from typing import Any, Callable, Dict, Union
+
+from google.protobuf.message import DecodeError
+
+from sfproto.sf.v1 import geometry_pb2
+from sfproto.geojson.v1.geojson_geometry import GEOM_TO_PB, GEOM_DECODERS
+from sfproto.geojson.v1.geojson_geometrycollection import (
+    geojson_geometrycollection_to_pb,
+    pb_to_geojson_geometrycollection,
+)
 
 GeoJSON = Dict[str, Any]
 
+# a feature geometry may also be a GeometryCollection, stored as Geometry.geometrycollection
+_FEATURE_GEOM_TO_PB: Dict[str, Callable[..., geometry_pb2.Geometry]] = {
+    **GEOM_TO_PB,
+    "GeometryCollection": geojson_geometrycollection_to_pb,
+}
+_FEATURE_GEOM_DECODERS: Dict[str, Callable[[geometry_pb2.Geometry], GeoJSON]] = {
+    **GEOM_DECODERS,
+    "geometrycollection": pb_to_geojson_geometrycollection,
+}
+
+
 def geojson_featurecollection_to_bytes(obj_or_json: Union[GeoJSON, str], srid: int = 0) -> bytes:
     """
-    Convert GeoJSON FeatureCollection -> Protobuf Geometry bytes.
+    Convert GeoJSON FeatureCollection -> Protobuf FeatureCollection bytes.
     Properties are ignored (always null).
     """
     # if input geojson is string, convert to dict
@@ -20,7 +39,7 @@ def geojson_featurecollection_to_bytes(obj_or_json: Union[GeoJSON, str], srid: i
     # only use this function if input type is feature collection
     if obj.get("type") != "FeatureCollection":
         raise ValueError(
-            f"Expected GeoJSON type=Feature, got: {obj.get('type')!r}"
+            f"Expected GeoJSON type=FeatureCollection, got: {obj.get('type')!r}"
         )
 
     # get features
@@ -28,28 +47,50 @@ def geojson_featurecollection_to_bytes(obj_or_json: Union[GeoJSON, str], srid: i
     if not isinstance(features, list):
         raise ValueError("FeatureCollection.features must be a list")
 
-    # make list in which the features will be stored
-    data: List[bytes] = []
-    # loop through the features in the feature collection and append each feature to the 'features' list
+    # one message for the whole collection, serialized once
+    fc = geometry_pb2.FeatureCollection()
+    fc.crs.srid = int(srid)
+
+    # loop through the features in the feature collection and build each geometry
+    # in place in fc.geoms (no copy); the geometries get no crs of their own
+    add = fc.geoms.add
     for feature in features:
-        data.append(geojson_feature_to_bytes(feature, srid=srid))
+        geometry = feature.get("geometry")
+        if geometry is None:
+            raise ValueError("Feature.geometry cannot be null")
+        gtype = geometry.get("type")
+        to_pb = _FEATURE_GEOM_TO_PB.get(gtype)
+        if to_pb is None:
+            raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+        to_pb(geometry, g=add())
 
-    return data
+    return fc.SerializeToString()
 
 
-def bytes_to_geojson_featurecollection(data: List[bytes]) -> GeoJSON:
+def bytes_to_geojson_featurecollection(data: bytes) -> GeoJSON:
     """
-    Convert list of Protobuf Geometry bytes -> GeoJSON FeatureCollection.
+    Convert Protobuf FeatureCollection bytes -> GeoJSON FeatureCollection.
     Properties are always null.
     """
+    try:
+        fc = geometry_pb2.FeatureCollection.FromString(data)
+    except DecodeError as e:
+        raise ValueError("Bytes do not contain a supported FeatureCollection") from e
+
     features = []
-    # append all feature items to the 'features' list
-    for item in data:
-        feature = bytes_to_geojson_feature(item)
-        features.append(feature)
+    # every geometry becomes one feature, decoded straight from the parsed message
+    for g in fc.geoms:
+        decoder = _FEATURE_GEOM_DECODERS.get(g.WhichOneof("geom"))
+        if decoder is None:
+            raise ValueError("FeatureCollection contains an unsupported Geometry")
+        features.append({
+            "type": "Feature",
+            "geometry": decoder(g),
+            "properties": None, # to make a valid geojson, properties are added, but set to 'None'
+        })
 
     # output feature collection format
     return {
         "type": "FeatureCollection",
         "features": features,
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from sfproto.sf.v1 import geometry_pb2
+from sfproto.geojson.v1.geojson_point import (
+    geojson_point_to_pb,
+    pb_to_geojson_point,
+    geojson_point_to_bytes,
+    bytes_to_geojson_point,
+)
+from sfproto.geojson.v1.geojson_multipoint import (
+    geojson_multipoint_to_pb,
+    pb_to_geojson_multipoint,
+    geojson_multipoint_to_bytes,
+    bytes_to_geojson_multipoint,
+)
+from sfproto.geojson.v1.geojson_linestring import (
+    geojson_linestring_to_pb,
+    pb_to_geojson_linestring,
+    geojson_linestring_to_bytes,
+    bytes_to_geojson_linestring,
+)
+from sfproto.geojson.v1.geojson_multilinestring import (
+    geojson_multilinestring_to_pb,
+    pb_to_geojson_multilinestring,
+    geojson_multilinestring_to_bytes,
+    bytes_to_geojson_multilinestring,
+)
+from sfproto.geojson.v1.geojson_polygon import (
+    geojson_polygon_to_pb,
+    pb_to_geojson_polygon,
+    geojson_polygon_to_bytes,
+    bytes_to_geojson_polygon,
+)
+from sfproto.geojson.v1.geojson_multipolygon import (
+    geojson_multipolygon_to_pb,
+    pb_to_geojson_multipolygon,
+    geojson_multipolygon_to_bytes,
+    bytes_to_geojson_multipolygon,
+)
+
+GeoJSON = Dict[str, Any]
+
+# dispatch tables shared by the v1 codecs (and by v4, which reuses the v1 geometries)
+
+# GeoJSON geometry type -> Geometry message builder: to_pb(obj, srid=..., g=None)
+GEOM_TO_PB: Dict[str, Callable[..., geometry_pb2.Geometry]] = {
+    "Point": geojson_point_to_pb,
+    "MultiPoint": geojson_multipoint_to_pb,
+    "LineString": geojson_linestring_to_pb,
+    "MultiLineString": geojson_multilinestring_to_pb,
+    "Polygon": geojson_polygon_to_pb,
+    "MultiPolygon": geojson_multipolygon_to_pb,
+}
+
+# Geometry oneof case -> decoder of the parsed message
+GEOM_DECODERS: Dict[str, Callable[[geometry_pb2.Geometry], GeoJSON]] = {
+    "point": pb_to_geojson_point,
+    "multipoint": pb_to_geojson_multipoint,
+    "line_string": pb_to_geojson_linestring,
+    "multilinestring": pb_to_geojson_multilinestring,
+    "polygon": pb_to_geojson_polygon,
+    "multipolygon": pb_to_geojson_multipolygon,
+}
+
+# GeoJSON geometry type -> standalone encoder: to_bytes(obj, srid=...)
+GEOM_TO_BYTES: Dict[str, Callable[..., bytes]] = {
+    "Point": geojson_point_to_bytes,
+    "MultiPoint": geojson_multipoint_to_bytes,
+    "LineString": geojson_linestring_to_bytes,
+    "MultiLineString": geojson_multilinestring_to_bytes,
+    "Polygon": geojson_polygon_to_bytes,
+    "MultiPolygon": geojson_multipolygon_to_bytes,
+}
+
+# Geometry oneof case -> decoder of the serialized message
+GEOM_BYTES_DECODERS: Dict[str, Callable[[bytes], GeoJSON]] = {
+    "point": bytes_to_geojson_point,
+    "multipoint": bytes_to_geojson_multipoint,
+    "line_string": bytes_to_geojson_linestring,
+    "multilinestring": bytes_to_geojson_multilinestring,
+    "polygon": bytes_to_geojson_polygon,
+    "multipolygon": bytes_to_geojson_multipolygon,
+}
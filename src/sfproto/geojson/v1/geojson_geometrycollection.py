@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
-from sfproto.geojson.v1.geojson_point import geojson_point_to_bytes, bytes_to_geojson_point
-from sfproto.geojson.v1.geojson_multipoint import geojson_multipoint_to_bytes, bytes_to_geojson_multipoint
-from sfproto.geojson.v1.geojson_linestring import geojson_linestring_to_bytes, bytes_to_geojson_linestring
-from sfproto.geojson.v1.geojson_multilinestring import geojson_multilinestring_to_bytes, bytes_to_geojson_multilinestring
-from sfproto.geojson.v1.geojson_polygon import geojson_polygon_to_bytes, bytes_to_geojson_polygon
-from sfproto.geojson.v1.geojson_multipolygon import geojson_multipolygon_to_bytes, bytes_to_geojson_multipolygon
+from google.protobuf.message import DecodeError
+
+from sfproto.sf.v1 import geometry_pb2
+
+from sfproto.geojson.v1.geojson_geometry import GEOM_TO_BYTES, GEOM_TO_PB, GEOM_DECODERS
 
 GeoJSON = Dict[str, Any]
 
@@ -24,49 +23,27 @@ def geojson_geometry_to_bytes(geometry: GeoJSON, srid: int = 0) -> bytes:
     if gtype is None:
         raise ValueError("Geometry.type is required")
 
-    if gtype == "Point":
-        return geojson_point_to_bytes(geometry, srid=srid)
-
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes(geometry, srid=srid)
-
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes(geometry, srid=srid)
-
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes(geometry, srid=srid)
-
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes(geometry, srid=srid)
-
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes(geometry, srid=srid)
-
-    if gtype == "GeometryCollection":
-        raise ValueError("Nested GeometryCollection is not supported")
-
-    raise ValueError(f"Unsupported geometry type: {gtype!r}")
+    to_bytes = GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        if gtype == "GeometryCollection":
+            raise ValueError("Nested GeometryCollection is not supported")
+        raise ValueError(f"Unsupported geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid)
 
 # decode 1 geometry
 def bytes_to_geojson_geometry(data: bytes) -> GeoJSON:
     """
     Convert Protobuf Geometry bytes -> GeoJSON *geometry object*.
-    Tries each supported geometry decoder.
+    Parses the bytes once and dispatches on the set oneof case.
     """
-    for decoder in (
-        bytes_to_geojson_point,
-        bytes_to_geojson_multipoint,
-        bytes_to_geojson_linestring,
-        bytes_to_geojson_multilinestring,
-        bytes_to_geojson_polygon,
-        bytes_to_geojson_multipolygon,
-    ):
-        try:
-            return decoder(data)
-        except Exception:
-            pass
-
-    raise ValueError("Bytes do not contain a supported Geometry")
+    try:
+        g = geometry_pb2.Geometry.FromString(data)
+    except DecodeError as e:
+        raise ValueError("Bytes do not contain a supported Geometry") from e
+    decoder = GEOM_DECODERS.get(g.WhichOneof("geom"))
+    if decoder is None:
+        raise ValueError("Bytes do not contain a supported Geometry")
+    return decoder(g)
 
 
 def geojson_geometrycollection_to_bytes(obj_or_json: Union[GeoJSON, str], srid: int = 0) -> List[bytes]:
@@ -99,6 +76,66 @@ def geojson_geometrycollection_to_bytes(obj_or_json: Union[GeoJSON, str], srid:
     return data
 
 
+def geojson_geometrycollection_to_pb(
+    obj: GeoJSON, srid: int = 0, g: Optional[geometry_pb2.Geometry] = None
+) -> geometry_pb2.Geometry:
+    """
+    Convert a GeoJSON GeometryCollection dict -> one Protobuf Geometry message
+    (Geometry.geometrycollection). Used for FeatureCollection members; the standalone
+    GeometryCollection bytes above stay a list of Geometry bytes.
+    If g is given, it is filled in place and its crs is left unset.
+    """
+    if obj.get("type") != "GeometryCollection":
+        raise ValueError(
+            f"Expected GeoJSON type=GeometryCollection, got: {obj.get('type')!r}"
+        )
+
+    geometries = obj.get("geometries")
+    if not isinstance(geometries, list):
+        raise ValueError("GeometryCollection.geometries must be a list")
+
+    if g is None:
+        g = geometry_pb2.Geometry()
+        g.crs.srid = int(srid)
+    # set the oneof even for an empty collection
+    g.geometrycollection.SetInParent()
+
+    # members are built straight into the repeated field; their crs stays unset
+    add = g.geometrycollection.geoms.add
+    for geom in geometries:
+        gtype = geom.get("type")
+        to_pb = GEOM_TO_PB.get(gtype)
+        if to_pb is None:
+            if gtype == "GeometryCollection":
+                raise ValueError("Nested GeometryCollection is not supported")
+            raise ValueError(f"Unsupported geometry type: {gtype!r}")
+        to_pb(geom, g=add())
+
+    return g
+
+
+def pb_to_geojson_geometrycollection(g: geometry_pb2.Geometry) -> GeoJSON:
+    """
+    Convert Protobuf Geometry message (geometrycollection) -> GeoJSON GeometryCollection.
+    """
+    if not g.HasField("geometrycollection"):
+        raise ValueError(
+            f"Expected Geometry.geometrycollection, got oneof={g.WhichOneof('geom')!r}"
+        )
+
+    geometries: List[GeoJSON] = []
+    for member in g.geometrycollection.geoms:
+        decoder = GEOM_DECODERS.get(member.WhichOneof("geom"))
+        if decoder is None:
+            raise ValueError("GeometryCollection contains an unsupported Geometry")
+        geometries.append(decoder(member))
+
+    return {
+        "type": "GeometryCollection",
+        "geometries": geometries,
+    }
+
+
 def bytes_to_geojson_geometrycollection(data: List[bytes]) -> GeoJSON:
     """
     Convert list of Protobuf Geometry bytes -> GeoJSON GeometryCollection.
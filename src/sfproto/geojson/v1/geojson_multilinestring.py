@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from sfproto.sf.v1 import geometry_pb2
 
@@ -11,9 +11,13 @@ GeoJSON = Dict[str, Any]
 # ============================================================
 # GeoJSON MultiLineString -> Protobuf Geometry
 # ============================================================
-def geojson_multilinestring_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
+def geojson_multilinestring_to_pb(
+    obj: GeoJSON, srid: int = 0, g: Optional[geometry_pb2.Geometry] = None
+) -> geometry_pb2.Geometry:
     """
     Convert a GeoJSON MultiLineString dict -> Protobuf Geometry message.
+    If g is given (e.g. FeatureCollection.geoms.add()), it is filled in place
+    and its crs is left unset.
     """
     if obj.get("type") != "MultiLineString":
         raise ValueError(
@@ -26,8 +30,9 @@ def geojson_multilinestring_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.G
             "GeoJSON MultiLineString coordinates must be a non-empty list of LineStrings"
         )
 
-    g = geometry_pb2.Geometry()
-    g.crs.srid = int(srid)
+    if g is None:
+        g = geometry_pb2.Geometry()
+        g.crs.srid = int(srid)
 
     for i, line in enumerate(lines):
         if not isinstance(line, (list, tuple)) or len(line) < 2:
@@ -37,6 +42,7 @@ def geojson_multilinestring_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.G
 
         # use multilinestring, linestring and coord message to create the geometry message
         pb_line = g.multilinestring.line_strings.add()
+        add_point = pb_line.points.add
 
         for j, pair in enumerate(line):
             if (
@@ -50,9 +56,9 @@ def geojson_multilinestring_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.G
                 )
 
             x, y = pair
-            p = pb_line.points.add()
-            p.coord.x = float(x)
-            p.coord.y = float(y)
+            c = add_point().coord
+            c.x = float(x)
+            c.y = float(y)
 
     return g
 
@@ -71,12 +77,13 @@ def pb_to_geojson_multilinestring(g: geometry_pb2.Geometry) -> GeoJSON:
         )
 
     # output MultiLineString geometry format
+    # (the nested coord is fetched once per vertex, not once per axis)
     return {
         "type": "MultiLineString",
         "coordinates": [
             [
-                [p.coord.x, p.coord.y]
-                for p in line.points
+                [c.x, c.y]
+                for c in (p.coord for p in line.points)
             ]
             for line in g.multilinestring.line_strings
         ],
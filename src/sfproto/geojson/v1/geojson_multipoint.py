@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from sfproto.sf.v1 import geometry_pb2
 
 GeoJSON = Dict[str, Any]
 
-def geojson_multipoint_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
+def geojson_multipoint_to_pb(
+    obj: GeoJSON, srid: int = 0, g: Optional[geometry_pb2.Geometry] = None
+) -> geometry_pb2.Geometry:
     """
     Convert a GeoJSON MultiPoint dict -> Protobuf Geometry message.
+    If g is given (e.g. FeatureCollection.geoms.add()), it is filled in place
+    and its crs is left unset.
     """
     if obj.get("type") != "MultiPoint":
         raise ValueError(
@@ -20,8 +24,9 @@ def geojson_multipoint_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geomet
     if not isinstance(coords, list):
         raise ValueError("MultiPoint coordinates must be a list")
 
-    g = geometry_pb2.Geometry()
-    g.crs.srid = int(srid)
+    if g is None:
+        g = geometry_pb2.Geometry()
+        g.crs.srid = int(srid)
 
     # use Coordinate, Point and MultiPoint messages to create a Geometry message
     for coord in coords:
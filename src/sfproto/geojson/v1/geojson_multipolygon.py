@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from sfproto.sf.v1 import geometry_pb2
 
 GeoJSON = Dict[str, Any]
 
 
-def geojson_multipolygon_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
+def geojson_multipolygon_to_pb(
+    obj: GeoJSON, srid: int = 0, g: Optional[geometry_pb2.Geometry] = None
+) -> geometry_pb2.Geometry:
     """
     Convert GeoJSON MultiPolygon -> Protobuf Geometry
+    If g is given (e.g. FeatureCollection.geoms.add()), it is filled in place
+    and its crs is left unset.
     """
     if obj.get("type") != "MultiPolygon":
         raise ValueError(
@@ -21,8 +25,9 @@ def geojson_multipolygon_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geom
     if not isinstance(polygons, list):
         raise ValueError("MultiPolygon coordinates must be a list")
 
-    g = geometry_pb2.Geometry()
-    g.crs.srid = int(srid)
+    if g is None:
+        g = geometry_pb2.Geometry()
+        g.crs.srid = int(srid)
 
     # use Coordinate, LinearRing, Polygon and MultiPolygon messages to create a Geometry message
     for poly in polygons:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from sfproto.sf.v1 import geometry_pb2
 
@@ -10,9 +10,13 @@ from sfproto.sf.v1 import geometry_pb2
 GeoJSON = Dict[str, Any]
 
 
-def geojson_point_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
+def geojson_point_to_pb(
+    obj: GeoJSON, srid: int = 0, g: Optional[geometry_pb2.Geometry] = None
+) -> geometry_pb2.Geometry:
     """
     Convert a GeoJSON Point dict -> Protobuf Geometry message.
+    If g is given (e.g. FeatureCollection.geoms.add()), it is filled in place
+    and its crs is left unset.
     """
     if obj.get("type") != "Point":
         raise ValueError(f"Expected GeoJSON type=Point, got: {obj.get('type')!r}")
@@ -26,8 +30,9 @@ def geojson_point_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
     if x is None or y is None:
         raise ValueError("GeoJSON Point coordinates cannot be null")
 
-    g = geometry_pb2.Geometry()
-    g.crs.srid = int(srid)
+    if g is None:
+        g = geometry_pb2.Geometry()
+        g.crs.srid = int(srid)
     g.point.coord.x = float(x)
     g.point.coord.y = float(y)
     return g
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from sfproto.sf.v1 import geometry_pb2
 
 GeoJSON = Dict[str, Any]
 
 
-def geojson_polygon_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
+def geojson_polygon_to_pb(
+    obj: GeoJSON, srid: int = 0, g: Optional[geometry_pb2.Geometry] = None
+) -> geometry_pb2.Geometry:
     """
     Convert a GeoJSON Polygon dict -> Protobuf Geometry message.
+    If g is given (e.g. FeatureCollection.geoms.add()), it is filled in place
+    and its crs is left unset.
     """
     if obj.get("type") != "Polygon":
         raise ValueError(f"Expected GeoJSON type=Polygon, got: {obj.get('type')!r}")
@@ -19,8 +23,9 @@ def geojson_polygon_to_pb(obj: GeoJSON, srid: int = 0) -> geometry_pb2.Geometry:
     if not isinstance(rings, list) or len(rings) == 0:
         raise ValueError("GeoJSON Polygon must have at least one linear ring")
 
-    g = geometry_pb2.Geometry()
-    g.crs.srid = int(srid)
+    if g is None:
+        g = geometry_pb2.Geometry()
+        g.crs.srid = int(srid)
 
     # use Coordinate, LinearRing and Polygon messages to create a Geometry message
     for ring in rings:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import List, Tuple, Union
+
+from sfproto.sf.v2 import geometry_pb2
+
+# coordinate helpers shared by the v2 delta codecs (LineString, Polygon and their Multi variants)
+
+
+def quantize_ring(ring: List[List[float]], scale: int) -> List[Tuple[int, int]]:
+    """
+    Validate and quantize one linear ring; the ring is closed if the input is not.
+    """
+    if not isinstance(ring, (list, tuple)) or len(ring) < 4:
+        raise ValueError("LinearRing must have at least 4 coordinates")
+
+    # Validate coords and quantize
+    sc = float(scale)
+    q: List[Tuple[int, int]] = []
+    append = q.append
+    for j, coord in enumerate(ring):
+        if not (isinstance(coord, (list, tuple)) and len(coord) >= 2):
+            raise ValueError(f"Polygon coordinates must be [x, y], got {coord!r} at index {j}")
+        if coord[0] is None or coord[1] is None:
+            raise ValueError(f"Polygon coordinates cannot be null, got {coord!r} at index {j}")
+        append((round(float(coord[0]) * sc), round(float(coord[1]) * sc)))
+
+    if q[0] != q[-1]:
+        q.append(q[0])
+
+    # After closing, a valid ring must still have >= 4 positions
+    if len(q) < 4:
+        raise ValueError("LinearRing must have at least 4 coordinates (after closure)")
+
+    return q
+
+
+def quantize_line(line: List[List[float]], scale: int) -> List[Tuple[int, int]]:
+    """Validate and quantize one LineString coordinate array."""
+    if not isinstance(line, (list, tuple)) or len(line) < 2:
+        raise ValueError("Each LineString must have at least two positions")
+
+    s = float(scale)
+    out: List[Tuple[int, int]] = []
+    append = out.append
+    for j, pair in enumerate(line):
+        if (
+            not isinstance(pair, (list, tuple))
+            or len(pair) < 2
+            or pair[0] is None
+            or pair[1] is None
+        ):
+            raise ValueError(f"Invalid coordinate at index {j}: {pair!r}")
+        append((round(float(pair[0]) * s), round(float(pair[1]) * s)))
+    return out
+
+
+def fill_delta(
+    pb: Union[geometry_pb2.DeltaLineString, geometry_pb2.DeltaRing],
+    q: List[Tuple[int, int]],
+) -> None:
+    """
+    Fill a DeltaLineString or DeltaRing in place from quantized points q:
+    the first point is stored absolute, the rest as dx/dy from the previous point.
+    """
+    x0, y0 = q[0]
+    pb.start.x = x0
+    pb.start.y = y0
+
+    dx: List[int] = []
+    dy: List[int] = []
+    prev_x, prev_y = x0, y0
+    for x, y in islice(q, 1, None):
+        dx.append(x - prev_x)
+        dy.append(y - prev_y)
+        prev_x, prev_y = x, y
+
+    pb.dx.extend(dx)
+    pb.dy.extend(dy)
+
+
+def decode_delta(
+    pb: Union[geometry_pb2.DeltaLineString, geometry_pb2.DeltaRing],
+    scale: int,
+) -> List[List[float]]:
+    """
+    Decode a DeltaLineString or DeltaRing to GeoJSON coords (floats).
+    """
+    if len(pb.dx) != len(pb.dy):
+        raise ValueError(f"dx/dy length mismatch: {len(pb.dx)} vs {len(pb.dy)}")
+
+    # a precomputed 1/scale multiply would not give bit-identical floats
+    s = float(scale)
+    x = pb.start.x
+    y = pb.start.y
+    coords: List[List[float]] = [[x / s, y / s]]
+    append = coords.append
+
+    for dx, dy in zip(pb.dx, pb.dy):
+        x += dx
+        y += dy
+        append([x / s, y / s])
+
+    return coords
+
+
+def decode_delta_ring(pb_ring: geometry_pb2.DeltaRing, scale: int) -> List[List[float]]:
+    """
+    Decode a DeltaRing; the output ring is always closed (GeoJSON requires this).
+    """
+    coords = decode_delta(pb_ring, scale)
+    if coords[0] != coords[-1]:
+        coords.append(coords[0])
+    return coords
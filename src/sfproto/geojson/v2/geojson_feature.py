@@ -2,12 +2,8 @@ from __future__ import annotations
 
 import json
 from typing import Any, Dict, Union
-from sfproto.geojson.v2.geojson_point import geojson_point_to_bytes_v2, bytes_to_geojson_point_v2
-from sfproto.geojson.v2.geojson_polygon import geojson_polygon_to_bytes_v2, bytes_to_geojson_polygon_v2
-from sfproto.geojson.v2.geojson_multipolygon import geojson_multipolygon_to_bytes_v2, bytes_to_geojson_multipolygon_v2
-from sfproto.geojson.v2.geojson_multipoint import geojson_multipoint_to_bytes_v2, bytes_to_geojson_multipoint_v2
-from sfproto.geojson.v2.geojson_linestring import geojson_linestring_to_bytes_v2, bytes_to_geojson_linestring_v2
-from sfproto.geojson.v2.geojson_multilinestring import geojson_multilinestring_to_bytes_v2, bytes_to_geojson_multilinestring_v2
+from sfproto.geojson.v2.geojson_geometry import GEOM_TO_BYTES
+from sfproto.geojson.v2.geojson_geometrycollection import bytes_to_geojson_geometry
 
 GeoJSON = Dict[str, Any]
 
@@ -38,26 +34,10 @@ def geojson_feature_to_bytes_v2(obj_or_json: Union[GeoJSON, str], srid: int = 0,
 
     gtype = geometry.get("type")
 
-    # get the geoemtry type and use the correct function (with scaling factor) for that type
-    if gtype == "Point":
-        return geojson_point_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    to_bytes = GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid, scale=scale)
 
 
 def bytes_to_geojson_feature_v2(data: bytes) -> GeoJSON:
@@ -65,25 +45,12 @@ def bytes_to_geojson_feature_v2(data: bytes) -> GeoJSON:
     Convert Protobuf Geometry bytes -> GeoJSON Feature.
     Properties are always null.
     """
-    # Try each geometry decoder
-    for decoder in (
-        bytes_to_geojson_point_v2,
-        bytes_to_geojson_multipoint_v2,
-        bytes_to_geojson_polygon_v2,
-        bytes_to_geojson_multipolygon_v2,
-        bytes_to_geojson_linestring_v2,
-        bytes_to_geojson_multilinestring_v2,
-    ):
-        try:
-            # try the geoemtry decoder function, the function with the same geometry type should then work
-            geometry = decoder(data)
-            # output geojson Feature format
-            return {
-                "type": "Feature",
-                "geometry": geometry,
-                "properties": None,
-            }
-        except Exception:
-            pass
-
-    raise ValueError("Bytes do not contain a supported Geometry")
\ No newline at end of file
+    # parse once and dispatch on the oneof case (instead of trying every decoder)
+    geometry = bytes_to_geojson_geometry(data)
+
+    # output geojson Feature format
+    return {
+        "type": "Feature",
+        "geometry": geometry,
+        "properties": None,
+    }
\ No newline at end of file
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from sfproto.sf.v2 import geometry_pb2
+from sfproto.geojson.v2.geojson_point import (
+    geojson_point_to_bytes_v2,
+    bytes_to_geojson_point_v2,
+    pb_to_geojson_point,
+)
+from sfproto.geojson.v2.geojson_multipoint import (
+    geojson_multipoint_to_bytes_v2,
+    bytes_to_geojson_multipoint_v2,
+    pb_to_geojson_multipoint,
+)
+from sfproto.geojson.v2.geojson_linestring import (
+    geojson_linestring_to_bytes_v2,
+    bytes_to_geojson_linestring_v2,
+    pb_to_geojson_linestring,
+)
+from sfproto.geojson.v2.geojson_multilinestring import (
+    geojson_multilinestring_to_bytes_v2,
+    bytes_to_geojson_multilinestring_v2,
+    pb_to_geojson_multilinestring,
+)
+from sfproto.geojson.v2.geojson_polygon import (
+    geojson_polygon_to_bytes_v2,
+    bytes_to_geojson_polygon_v2,
+    pb_to_geojson_polygon,
+)
+from sfproto.geojson.v2.geojson_multipolygon import (
+    geojson_multipolygon_to_bytes_v2,
+    bytes_to_geojson_multipolygon_v2,
+    pb_to_geojson_multipolygon,
+)
+
+GeoJSON = Dict[str, Any]
+
+# dispatch tables shared by the v2 codecs (and by v5/v6/v7, which reuse the v2 geometries)
+
+# GeoJSON geometry type -> standalone encoder: to_bytes(obj, srid=..., scale=...)
+GEOM_TO_BYTES: Dict[str, Callable[..., bytes]] = {
+    "Point": geojson_point_to_bytes_v2,
+    "MultiPoint": geojson_multipoint_to_bytes_v2,
+    "LineString": geojson_linestring_to_bytes_v2,
+    "MultiLineString": geojson_multilinestring_to_bytes_v2,
+    "Polygon": geojson_polygon_to_bytes_v2,
+    "MultiPolygon": geojson_multipolygon_to_bytes_v2,
+}
+
+# Geometry oneof case -> decoder of the parsed message
+GEOM_DECODERS: Dict[str, Callable[[geometry_pb2.Geometry], GeoJSON]] = {
+    "point": pb_to_geojson_point,
+    "multipoint": pb_to_geojson_multipoint,
+    "line_string": pb_to_geojson_linestring,
+    "multilinestring": pb_to_geojson_multilinestring,
+    "polygon": pb_to_geojson_polygon,
+    "multipolygon": pb_to_geojson_multipolygon,
+}
+
+# Geometry oneof case -> decoder of the serialized message
+GEOM_BYTES_DECODERS: Dict[str, Callable[[bytes], GeoJSON]] = {
+    "point": bytes_to_geojson_point_v2,
+    "multipoint": bytes_to_geojson_multipoint_v2,
+    "line_string": bytes_to_geojson_linestring_v2,
+    "multilinestring": bytes_to_geojson_multilinestring_v2,
+    "polygon": bytes_to_geojson_polygon_v2,
+    "multipolygon": bytes_to_geojson_multipolygon_v2,
+}
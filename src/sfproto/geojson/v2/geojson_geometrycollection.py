@@ -3,12 +3,11 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Union
 
-from sfproto.geojson.v2.geojson_point import geojson_point_to_bytes_v2, bytes_to_geojson_point_v2
-from sfproto.geojson.v2.geojson_multipoint import geojson_multipoint_to_bytes_v2, bytes_to_geojson_multipoint_v2
-from sfproto.geojson.v2.geojson_linestring import geojson_linestring_to_bytes_v2, bytes_to_geojson_linestring_v2
-from sfproto.geojson.v2.geojson_multilinestring import geojson_multilinestring_to_bytes_v2, bytes_to_geojson_multilinestring_v2
-from sfproto.geojson.v2.geojson_polygon import geojson_polygon_to_bytes_v2, bytes_to_geojson_polygon_v2
-from sfproto.geojson.v2.geojson_multipolygon import geojson_multipolygon_to_bytes_v2, bytes_to_geojson_multipolygon_v2
+from google.protobuf.message import DecodeError
+
+from sfproto.sf.v2 import geometry_pb2
+
+from sfproto.geojson.v2.geojson_geometry import GEOM_TO_BYTES, GEOM_DECODERS
 
 GeoJSON = Dict[str, Any]
 
@@ -27,51 +26,29 @@ def geojson_geometry_to_bytes(geometry: GeoJSON, srid: int = 0, scale: int = DEF
     if gtype is None:
         raise ValueError("Geometry.type is required")
 
-    if gtype == "Point":
-        return geojson_point_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    # Spec allows nested GeometryCollections, but in many Simple Features contexts
-    # it is excluded. Keep it explicit and safe.
-    if gtype == "GeometryCollection":
-        raise ValueError("Nested GeometryCollection is not supported")
-
-    raise ValueError(f"Unsupported geometry type: {gtype!r}")
+    to_bytes = GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        # Spec allows nested GeometryCollections, but in many Simple Features contexts
+        # it is excluded. Keep it explicit and safe.
+        if gtype == "GeometryCollection":
+            raise ValueError("Nested GeometryCollection is not supported")
+        raise ValueError(f"Unsupported geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid, scale=scale)
 
 # decode 1 geometry
 def bytes_to_geojson_geometry(data: bytes) -> GeoJSON:
     """
     Convert Protobuf Geometry bytes -> GeoJSON *geometry object*.
-    Tries each supported geometry decoder.
+    Parses the bytes once and dispatches on the set oneof case.
     """
-    for decoder in (
-        bytes_to_geojson_point_v2,
-        bytes_to_geojson_multipoint_v2,
-        bytes_to_geojson_linestring_v2,
-        bytes_to_geojson_multilinestring_v2,
-        bytes_to_geojson_polygon_v2,
-        bytes_to_geojson_multipolygon_v2,
-    ):
-        try:
-            return decoder(data)
-        except Exception:
-            pass
-
-    raise ValueError("Bytes do not contain a supported Geometry")
+    try:
+        g = geometry_pb2.Geometry.FromString(data)
+    except DecodeError as e:
+        raise ValueError("Bytes do not contain a supported Geometry") from e
+    decoder = GEOM_DECODERS.get(g.WhichOneof("geom"))
+    if decoder is None:
+        raise ValueError("Bytes do not contain a supported Geometry")
+    return decoder(g)
 
 
 def geojson_geometrycollection_to_bytes_v2( obj_or_json: Union[GeoJSON, str], srid: int = 0, scale: int = DEFAULT_SCALE) -> List[bytes]:
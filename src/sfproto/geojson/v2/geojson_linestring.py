@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Union, List, Tuple
+from typing import Any, Dict, Union
 
+from sfproto.geojson.v2.geojson_delta import decode_delta, fill_delta, quantize_line
 from sfproto.sf.v2 import geometry_pb2
 
 GeoJSON = Dict[str, Any]
@@ -17,14 +18,6 @@ def _require_scale(scale: int) -> int:
         raise ValueError("scale must be a positive integer (e.g., 10000000)")
     return scale
 
-def _quantize(value: float, scale: int) -> int:
-    # multiply the floating number with scaler value and round to a integer
-    return int(round(float(value) * scale))
-
-def _dequantize(value_i: int, scale: int) -> float:
-    # divide by scaler to get 'normal' float number back again (less precision)
-    return float(value_i) / float(scale)
-
 # ============================================================
 # GeoJSON LineString -> Protobuf Geometry
 # ============================================================
@@ -46,35 +39,15 @@ def geojson_linestring_to_pb(obj: GeoJSON, srid: int = 0, scale: int = DEFAULT_S
 
     scale = _require_scale(scale)
 
-    # new list of integer coords with delta encoding to next points
-    # so first point is absolute, rest is are relative delta values
-    q: List[Tuple[int,int]] = []
-    for i, pair in enumerate(coords):
-        if (
-            not isinstance(pair, (list, tuple))
-            or len(pair) < 2
-            or pair[0] is None
-            or pair[1] is None
-        ):
-            raise ValueError(f"Invalid coordinate at index {i}: {pair!r}")
-        x, y = pair
-        q.append((_quantize(x,scale), _quantize(y,scale)))
-
-        g = geometry_pb2.Geometry()
-        g.crs.srid = int(srid)
-        g.crs.scale = int(scale)
-
-        ls = g.line_string # delta line_string
-        x0,y0 = q[0]
-        ls.start.x = x0
-        ls.start.y = y0
-
-        # store as delta values from each other
-        prev_x, prev_y = x0,y0
-        for (x, y) in q[1:]:
-            ls.dx.append(int(x-prev_x))
-            ls.dy.append(int(y-prev_y))
-            prev_x, prev_y = x, y
+    # integer coords with delta encoding to next points
+    # so first point is absolute, rest is are relative delta values.
+    q = quantize_line(coords, scale)
+
+    g = geometry_pb2.Geometry()
+    g.crs.srid = int(srid)
+    g.crs.scale = int(scale)
+
+    fill_delta(g.line_string, q) # delta line_string
 
     return g
 
@@ -95,19 +68,7 @@ def pb_to_geojson_linestring(g: geometry_pb2.Geometry) -> GeoJSON:
     scale = int(getattr(g.crs, "scale", 0)) or DEFAULT_SCALE
     scale = _require_scale(scale)
 
-    ls = g.line_string # delta line_string
-
-    coords_out: List[List[float]] = []
-
-    #start point
-    x = int(ls.start.x)
-    y = int(ls.start.y)
-    coords_out.append([_dequantize(x,scale), _dequantize(y,scale)])
-
-    for dx, dy in zip(ls.dx, ls.dy):
-        x += int(dx)
-        y += int(dy)
-        coords_out.append([_dequantize(x,scale), _dequantize(y,scale)])
+    coords_out = decode_delta(g.line_string, scale) # delta line_string
 
     # output format of LineString geometry
     return {
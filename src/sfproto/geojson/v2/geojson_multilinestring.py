@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Union
 
+from sfproto.geojson.v2.geojson_delta import decode_delta, fill_delta, quantize_line
 from sfproto.sf.v2 import geometry_pb2
 
 GeoJSON = Dict[str, Any]
@@ -17,65 +18,6 @@ def _require_scale(scale: int) -> int:
     return scale
 
 
-def _quantize(value: float, scale: int) -> int:
-    # multiply the floating number with scaler value and round to a integer
-    return int(round(float(value) * scale))
-
-
-def _dequantize(value_i: int, scale: int) -> float:
-    # divide by scaler to get 'normal' float number back again (less precision)
-    return float(value_i) / float(scale)
-
-
-def _quantize_line(line: List[List[float]], scale: int) -> List[Tuple[int, int]]:
-    """Validate and quantize one LineString coordinate array."""
-    if not isinstance(line, (list, tuple)) or len(line) < 2:
-        raise ValueError("Each LineString must have at least two positions")
-
-    out: List[Tuple[int, int]] = []
-    for j, pair in enumerate(line):
-        if (
-            not isinstance(pair, (list, tuple))
-            or len(pair) < 2
-            or pair[0] is None
-            or pair[1] is None
-        ):
-            raise ValueError(f"Invalid coordinate at index {j}: {pair!r}")
-        out.append((_quantize(pair[0], scale), _quantize(pair[1], scale)))
-    return out
-
-
-def _fill_delta_line(pb_line: geometry_pb2.DeltaLineString, q: List[Tuple[int, int]]) -> None:
-    """Fill a DeltaLineString from quantized points q."""
-    x0, y0 = q[0]
-    pb_line.start.x = int(x0)
-    pb_line.start.y = int(y0)
-
-    prev_x, prev_y = x0, y0
-    for (x, y) in q[1:]:
-        pb_line.dx.append(int(x - prev_x))
-        pb_line.dy.append(int(y - prev_y))
-        prev_x, prev_y = x, y
-
-
-def _decode_delta_line(pb_line: geometry_pb2.DeltaLineString, scale: int) -> List[List[float]]:
-    """Decode a DeltaLineString to GeoJSON coords (floats)."""
-    if len(pb_line.dx) != len(pb_line.dy):
-        raise ValueError(f"dx/dy length mismatch: {len(pb_line.dx)} vs {len(pb_line.dy)}")
-
-    coords: List[List[float]] = []
-    x = int(pb_line.start.x)
-    y = int(pb_line.start.y)
-    coords.append([_dequantize(x, scale), _dequantize(y, scale)])
-
-    for dx, dy in zip(pb_line.dx, pb_line.dy):
-        x += int(dx)
-        y += int(dy)
-        coords.append([_dequantize(x, scale), _dequantize(y, scale)])
-
-    return coords
-
-
 # ============================================================
 # GeoJSON MultiLineString -> Protobuf Geometry (v2)
 # ============================================================
@@ -98,9 +40,9 @@ def geojson_multilinestring_to_pb(obj: GeoJSON,srid: int = 0,scale: int = DEFAUL
     g.crs.scale = int(scale)
 
     for i, line in enumerate(lines):
-        q = _quantize_line(line, scale)  # quantized points for this line only
+        q = quantize_line(line, scale)  # quantized points for this line only
         pb_line = g.multilinestring.line_strings.add()
-        _fill_delta_line(pb_line, q)
+        fill_delta(pb_line, q)
 
     return g
 
@@ -121,7 +63,7 @@ def pb_to_geojson_multilinestring(g: geometry_pb2.Geometry) -> GeoJSON:
 
     coords_out: List[List[List[float]]] = []
     for pb_line in g.multilinestring.line_strings:
-        coords_out.append(_decode_delta_line(pb_line, scale))
+        coords_out.append(decode_delta(pb_line, scale))
 
     # output MultiLineString geometry format
     return {"type": "MultiLineString", "coordinates": coords_out}
@@ -19,7 +19,7 @@ def _require_scale(scale: int) -> int:
 
 def _quantize(value: float, scale: int) -> int:
     # multiply the floating number with scaler value and round to a integer
-    return int(round(float(value) * scale))
+    return round(float(value) * scale)
 
 def _dequantize(value_i: int, scale: int) -> float:
     # divide by scaler to get 'normal' float number back again (less precision)
@@ -42,13 +42,15 @@ def geojson_multipoint_to_pb( obj: GeoJSON, srid: int = 0, scale: int = DEFAULT_
     g.crs.srid = int(srid)
     g.crs.scale = int(scale)
 
+    sc = float(scale)
+    add_point = g.multipoint.points.add
     for coord in coords:
         if not (isinstance(coord, (list, tuple)) and len(coord) >= 2):
             raise ValueError("Each MultiPoint coordinate must be [x, y]")
 
-        p = g.multipoint.points.add()
-        p.coord.x = _quantize(coord[0], scale)
-        p.coord.y = _quantize(coord[1], scale)
+        c = add_point().coord
+        c.x = round(float(coord[0]) * sc)
+        c.y = round(float(coord[1]) * sc)
 
     return g
 
@@ -64,10 +66,14 @@ def pb_to_geojson_multipoint(g: geometry_pb2.Geometry) -> GeoJSON:
 
     scale = int(getattr(g.crs, "scale", 0)) or DEFAULT_SCALE
     scale = _require_scale(scale)
+    # a precomputed 1/scale multiply would not give bit-identical floats
+    s = float(scale)
     coordinates: List[List[float]] = []
+    append = coordinates.append
 
     for p in g.multipoint.points:
-        coordinates.append([_dequantize(p.coord.x,scale), _dequantize(p.coord.y,scale)])
+        c = p.coord
+        append([c.x / s, c.y / s])
 
     # output GeoJSON MultiPoint format
     return {
@@ -21,7 +21,7 @@ def _require_scale(scale: int) -> int:
 
 def _quantize(value: float, scale: int) -> int:
     # multiply the floating number with scaler value and round to a integer
-    return int(round(float(value) * scale))
+    return round(float(value) * scale)
 
 def _dequantize(value_i: int, scale: int) -> float:
     # divide by scaler to get 'normal' float number back again (less precision)
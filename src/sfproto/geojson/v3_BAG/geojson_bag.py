@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import uuid
-from typing import Any, Dict, List, Union, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Any, Dict, List, Union, Optional
 
 # This module name depends on how you compile your .proto.
 # Example:
@@ -18,6 +20,14 @@ GeoJSON = Dict[str, Any]
 DEFAULT_SRID = 28992
 DEFAULT_SCALE = 1000  # mm precision for EPSG:28992
 
+# Generated symbols used per feature/ring, bound once at import so the hot
+# paths don't repeat the pand_pb2.<name> module attribute lookup.
+_BBoxQ = pand_pb2.BBoxQ
+_DeltaRing = pand_pb2.DeltaRing
+_Polygon = pand_pb2.Polygon
+_PandProperties = pand_pb2.PandProperties
+_STATUS_UNSPECIFIED = pand_pb2.PAND_STATUS_UNSPECIFIED
+
 # --- Enum mapping ---
 
 STATUS_MAP = {
@@ -46,31 +56,43 @@ GEBRUIKSDOEL_MAP = {
 
 GEBRUIKSDOEL_MAP_REV = {v: k for k, v in GEBRUIKSDOEL_MAP.items()}
 
+# bound lookups for the per-feature property (de)coders
+_status_get = STATUS_MAP.get
+_status_rev_get = STATUS_MAP_REV.get
+_gd_get = GEBRUIKSDOEL_MAP.get
+
 
 
 # --- Quantization helpers ---
 
 def _q(val: float, scale: int) -> int:
-    return int(round(val * scale))
+    return round(float(val) * scale)
 
 
 def _uq(val_q: int, scale: int) -> float:
     return val_q / float(scale)
 
 
-def _bbox_to_bboxq(bbox: List[float], scale: int) -> pand_pb2.BBoxQ:
+def _fill_bboxq(b: pand_pb2.BBoxQ, bbox: List[float], scale: int) -> None:
     if len(bbox) != 4:
         raise ValueError(f"Expected bbox length 4, got {len(bbox)}")
-    return pand_pb2.BBoxQ(
-        minx=_q(bbox[0], scale),
-        miny=_q(bbox[1], scale),
-        maxx=_q(bbox[2], scale),
-        maxy=_q(bbox[3], scale),
-    )
+    # _q inlined (round() of a float already returns an int)
+    b.minx = round(bbox[0] * scale)
+    b.miny = round(bbox[1] * scale)
+    b.maxx = round(bbox[2] * scale)
+    b.maxy = round(bbox[3] * scale)
+
+
+def _bbox_to_bboxq(bbox: List[float], scale: int) -> pand_pb2.BBoxQ:
+    b = _BBoxQ()
+    _fill_bboxq(b, bbox, scale)
+    return b
 
 
 def _bboxq_to_bbox(b: pand_pb2.BBoxQ, scale: int) -> List[float]:
-    return [_uq(b.minx, scale), _uq(b.miny, scale), _uq(b.maxx, scale), _uq(b.maxy, scale)]
+    # _uq inlined
+    s = float(scale)
+    return [b.minx / s, b.miny / s, b.maxx / s, b.maxy / s]
 
 
 # --- UUID helpers ---
@@ -79,86 +101,114 @@ def _feature_id_to_uuid_bytes(feature_id: str) -> bytes:
     """
     GeoJSON id example: "pand.4a7241b2-e5e6-4850-b084-687ab8f675c8"
     Store only the UUID portion as 16 bytes.
+    The canonical 8-4-4-4-12 form is parsed with bytes.fromhex (no UUID object/int
+    per feature); any other form is left to uuid.UUID, which validates it.
     """
     if not isinstance(feature_id, str):
         raise ValueError("Feature.id must be a string")
     if feature_id.startswith("pand."):
-        feature_id = feature_id[len("pand."):]
-    u = uuid.UUID(feature_id)
-    return u.bytes
+        feature_id = feature_id[5:]
+    if (
+        len(feature_id) == 36
+        and feature_id[8] == "-"
+        and feature_id[13] == "-"
+        and feature_id[18] == "-"
+        and feature_id[23] == "-"
+    ):
+        try:
+            u = bytes.fromhex(feature_id.replace("-", "", 4))
+        except ValueError:
+            u = b""
+        if len(u) == 16:
+            return u
+    return uuid.UUID(feature_id).bytes
 
 
 def _uuid_bytes_to_feature_id(u_bytes: bytes) -> str:
     if not isinstance(u_bytes, (bytes, bytearray)) or len(u_bytes) != 16:
         raise ValueError("uuid bytes must be 16 bytes")
-    return "pand." + str(uuid.UUID(bytes=bytes(u_bytes)))
+    h = u_bytes.hex()
+    return f"pand.{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
 
 
 # --- Geometry helpers (Polygon only) ---
 
-def _ring_drop_closing_point(coords: List[List[float]]) -> List[List[float]]:
+def _fill_delta_ring(pb_ring: pand_pb2.DeltaRing, ring_coords: List[List[float]], scale: int) -> None:
     """
-    coords: [[x,y], [x,y], ..., [x,y]] possibly closed.
-    If last equals first, drop last.
-    """
-    if len(coords) >= 2 and coords[0][0] == coords[-1][0] and coords[0][1] == coords[-1][1]:
-        return coords[:-1]
-    return coords
-
-
-def _encode_delta_ring(ring_coords: List[List[float]], scale: int) -> pand_pb2.DeltaRing:
-    """
-    Encode a ring as start + dx/dy, with implicit closure:
+    Encode a ring as start + dx/dy into an existing DeltaRing message, with implicit closure:
     closing point is omitted if present in input.
+    Writing in place (e.g. into polygon.rings.add()) avoids building a temporary
+    DeltaRing and copying it into the parent message.
     """
-    ring_coords = _ring_drop_closing_point(ring_coords)
-
-    if len(ring_coords) < 3:
+    # drop the closing point (last == first) by count, without copying the ring
+    n = len(ring_coords)
+    if n >= 2:
+        first = ring_coords[0]
+        last = ring_coords[-1]
+        if first[0] == last[0] and first[1] == last[1]:
+            n -= 1
+
+    if n < 3:
         raise ValueError("Ring must have at least 3 distinct points (excluding closure)")
 
-    qpts: List[Tuple[int, int]] = [(_q(x, scale), _q(y, scale)) for x, y in ring_coords]
+    # quantize and delta in a single pass (round() on a float already returns an int)
+    s = float(scale)
+    it = islice(ring_coords, n)
+    x, y = next(it)
+    prevx = round(x * s)
+    prevy = round(y * s)
+    pb_ring.start.x = prevx
+    pb_ring.start.y = prevy
 
-    startx, starty = qpts[0]
     dx: List[int] = []
     dy: List[int] = []
+    for x, y in it:
+        qx = round(x * s)
+        qy = round(y * s)
+        dx.append(qx - prevx)
+        dy.append(qy - prevy)
+        prevx, prevy = qx, qy
+
+    pb_ring.dx.extend(dx)
+    pb_ring.dy.extend(dy)
 
-    prevx, prevy = startx, starty
-    for (x, y) in qpts[1:]:
-        dx.append(x - prevx)
-        dy.append(y - prevy)
-        prevx, prevy = x, y
 
-    return pand_pb2.DeltaRing(
-        start=pand_pb2.CoordinateQ(x=startx, y=starty),
-        dx=dx,
-        dy=dy,
-    )
+def _encode_delta_ring(ring_coords: List[List[float]], scale: int) -> pand_pb2.DeltaRing:
+    """
+    Encode a ring as a standalone DeltaRing message (see _fill_delta_ring).
+    """
+    r = _DeltaRing()
+    _fill_delta_ring(r, ring_coords, scale=scale)
+    return r
 
 
 def _decode_delta_ring(r: pand_pb2.DeltaRing, scale: int) -> List[List[float]]:
     """
     Decode ring and CLOSE it for GeoJSON by appending start at the end.
     """
-    pts_q: List[Tuple[int, int]] = []
-    x = r.start.x
-    y = r.start.y
-    pts_q.append((x, y))
-
     if len(r.dx) != len(r.dy):
         raise ValueError("DeltaRing dx/dy length mismatch")
 
-    for i in range(len(r.dx)):
-        x += r.dx[i]
-        y += r.dy[i]
-        pts_q.append((x, y))
+    # accumulate and dequantize in a single pass
+    s = float(scale)
+    x = r.start.x
+    y = r.start.y
+    first = [x / s, y / s]
+    coords: List[List[float]] = [first]
+    append = coords.append
+
+    for ddx, ddy in zip(r.dx, r.dy):
+        x += ddx
+        y += ddy
+        append([x / s, y / s])
 
     # close ring for GeoJSON
-    pts_q.append(pts_q[0])
+    append([first[0], first[1]])
 
-    return [[_uq(px, scale), _uq(py, scale)] for px, py in pts_q]
+    return coords
 
 
-def _encode_polygon(geojson_geom: GeoJSON, scale: int) -> pand_pb2.Polygon:
+def _fill_polygon(poly: pand_pb2.Polygon, geojson_geom: GeoJSON, scale: int) -> None:
     if geojson_geom.get("type") != "Polygon":
         raise ValueError(f"Expected geometry type Polygon, got {geojson_geom.get('type')!r}")
 
@@ -166,25 +216,26 @@ def _encode_polygon(geojson_geom: GeoJSON, scale: int) -> pand_pb2.Polygon:
     if not isinstance(coords, list) or not coords:
         raise ValueError("Polygon.coordinates must be a non-empty list")
 
-    rings: List[pand_pb2.DeltaRing] = []
     for ring in coords:
         if not isinstance(ring, list) or not ring:
             raise ValueError("Polygon ring must be a non-empty list")
-        rings.append(_encode_delta_ring(ring, scale=scale))
+        _fill_delta_ring(poly.rings.add(), ring, scale=scale)
+
 
-    return pand_pb2.Polygon(rings=rings)
+def _encode_polygon(geojson_geom: GeoJSON, scale: int) -> pand_pb2.Polygon:
+    poly = _Polygon()
+    _fill_polygon(poly, geojson_geom, scale=scale)
+    return poly
 
 
 def _decode_polygon(poly: pand_pb2.Polygon, scale: int) -> GeoJSON:
-    rings_coords: List[List[List[float]]] = []
-    for ring in poly.rings:
-        rings_coords.append(_decode_delta_ring(ring, scale=scale))
+    rings_coords: List[List[List[float]]] = [_decode_delta_ring(ring, scale) for ring in poly.rings]
     return {"type": "Polygon", "coordinates": rings_coords}
 
 
 # --- Properties helpers (PandProperties) ---
 
-def _encode_properties(props: GeoJSON) -> pand_pb2.PandProperties:
+def _fill_properties(out: pand_pb2.PandProperties, props: GeoJSON) -> None:
     if not isinstance(props, dict):
         raise ValueError("Feature.properties must be an object")
 
@@ -198,7 +249,7 @@ def _encode_properties(props: GeoJSON) -> pand_pb2.PandProperties:
         raise ValueError("properties.bouwjaar must be an int")
 
     status_str = str(props.get("status", ""))
-    status_enum = STATUS_MAP.get(status_str, pand_pb2.PAND_STATUS_UNSPECIFIED)
+    status_enum = _status_get(status_str, _STATUS_UNSPECIFIED)
 
     # --- FIX: multi-valued gebruiksdoel ---
     gebruiksdoel_raw = props.get("gebruiksdoel", "")
@@ -207,7 +258,7 @@ def _encode_properties(props: GeoJSON) -> pand_pb2.PandProperties:
     if isinstance(gebruiksdoel_raw, str) and gebruiksdoel_raw.strip():
         for token in gebruiksdoel_raw.split(","):
             token = token.strip()
-            enum_val = GEBRUIKSDOEL_MAP.get(token)
+            enum_val = _gd_get(token)
             if enum_val is not None:
                 doelen.append(enum_val)
 
@@ -215,12 +266,10 @@ def _encode_properties(props: GeoJSON) -> pand_pb2.PandProperties:
     if not isinstance(aantal_vo, int):
         raise ValueError("properties.aantal_verblijfsobjecten must be an int")
 
-    out = pand_pb2.PandProperties(
-        identificatie=ident_u64,
-        bouwjaar=bouwjaar,
-        status=status_enum,
-        aantal_verblijfsobjecten=aantal_vo,
-    )
+    out.identificatie = ident_u64
+    out.bouwjaar = bouwjaar
+    out.status = status_enum
+    out.aantal_verblijfsobjecten = aantal_vo
 
     # add repeated enums
     out.gebruiksdoelen.extend(doelen)
@@ -231,6 +280,10 @@ def _encode_properties(props: GeoJSON) -> pand_pb2.PandProperties:
     if props.get("oppervlakte_max") is not None:
         out.oppervlakte_max = int(props["oppervlakte_max"])
 
+
+def _encode_properties(props: GeoJSON) -> pand_pb2.PandProperties:
+    out = _PandProperties()
+    _fill_properties(out, props)
     return out
 
 
@@ -239,7 +292,7 @@ def _decode_properties(p: pand_pb2.PandProperties) -> GeoJSON:
     props: GeoJSON = {
         "identificatie": f"{p.identificatie:016d}",
         "bouwjaar": int(p.bouwjaar),
-        "status": STATUS_MAP_REV.get(p.status, ""),
+        "status": _status_rev_get(p.status, ""),
         "aantal_verblijfsobjecten": int(p.aantal_verblijfsobjecten),
         "rdf_seealso": f"http://bag.basisregistraties.overheid.nl/bag/id/pand/{p.identificatie:016d}",
     }
@@ -247,7 +300,7 @@ def _decode_properties(p: pand_pb2.PandProperties) -> GeoJSON:
     # --- FIX: repeated gebruiksdoelen ---
     if p.gebruiksdoelen:
         doelen = [
-            GEBRUIKSDOEL_MAP_REV.get(d, "")
+            GEBRUIKSDOEL_MAP_REV[d]
             for d in p.gebruiksdoelen
             if d in GEBRUIKSDOEL_MAP_REV
         ]
@@ -264,12 +317,56 @@ def _decode_properties(p: pand_pb2.PandProperties) -> GeoJSON:
 
 
 
+# --- Feature encoding ---
+
+def _add_features(fc: pand_pb2.PandFeatureCollection, features: List[Any], scale: int) -> None:
+    # single pass over the features: each one, and its properties/bbox/geometry
+    # submessages, is written straight into fc.features (no temporary messages
+    # that would be copied again on append/CopyFrom)
+    for feat in features:
+        if not isinstance(feat, dict) or feat.get("type") != "Feature":
+            raise ValueError("Each item in features must be a GeoJSON Feature object")
+
+        f = fc.features.add()
+
+        # id -> uuid bytes
+        fid = feat.get("id")
+        if fid is not None:
+            f.uuid = _feature_id_to_uuid_bytes(fid)
+
+        # properties
+        _fill_properties(f.properties, feat.get("properties", {}))
+
+        # feature bbox (optional)
+        if "bbox" in feat and isinstance(feat["bbox"], list) and len(feat["bbox"]) == 4:
+            _fill_bboxq(f.bbox, feat["bbox"], scale=scale)
+
+        # geometry
+        geom = feat.get("geometry")
+        if not isinstance(geom, dict):
+            raise ValueError("Feature.geometry must be an object")
+        _fill_polygon(f.geometry, geom, scale=scale)
+
+
+def _encode_features_chunk(features: List[Any], scale: int) -> bytes:
+    """
+    Worker for parallel encoding: serialize a PandFeatureCollection holding only
+    `features`. Serialized messages concatenate as a merge, so these chunks can be
+    appended to the serialized collection header (repeated features just extend).
+    """
+    fc = pand_pb2.PandFeatureCollection()
+    _add_features(fc, features, scale)
+    return fc.SerializeToString()
+
+
+
 # --- Public API (mirrors your previous style) ---
 
 def geojson_pand_featurecollection_to_bytes(
     obj_or_json: Union[GeoJSON, str],
     srid: int = DEFAULT_SRID,
     scale: int = DEFAULT_SCALE,
+    workers: Optional[int] = None,
 ) -> bytes:
     """
     Convert BAG 'pand' GeoJSON FeatureCollection -> PandFeatureCollection Protobuf bytes.
@@ -279,6 +376,12 @@ def geojson_pand_featurecollection_to_bytes(
     - Geometry is Polygon
     - Polygon ring closure is implicit in Protobuf (closing point omitted)
     - identificatie stored as uint64
+
+    workers > 1 encodes chunks of features in that many processes. Output is the
+    same bytes; it only pays off for large collections on multi-core machines,
+    since the features have to be pickled to the workers.
+    On platforms that start worker processes with spawn (Windows, macOS), call it
+    with workers > 1 only under an `if __name__ == "__main__":` guard.
     """
     if isinstance(obj_or_json, str):
         obj = json.loads(obj_or_json)
@@ -298,35 +401,19 @@ def geojson_pand_featurecollection_to_bytes(
 
     # collection bbox (optional)
     if "bbox" in obj and isinstance(obj["bbox"], list) and len(obj["bbox"]) == 4:
-        fc.bbox.CopyFrom(_bbox_to_bboxq(obj["bbox"], scale=scale))
-
-    for feat in features:
-        if not isinstance(feat, dict) or feat.get("type") != "Feature":
-            raise ValueError("Each item in features must be a GeoJSON Feature object")
-
-        f = pand_pb2.PandFeature()
-
-        # id -> uuid bytes
-        fid = feat.get("id")
-        if fid is not None:
-            f.uuid = _feature_id_to_uuid_bytes(fid)
-
-        # properties
-        f.properties.CopyFrom(_encode_properties(feat.get("properties", {})))
-
-        # feature bbox (optional)
-        if "bbox" in feat and isinstance(feat["bbox"], list) and len(feat["bbox"]) == 4:
-            f.bbox.CopyFrom(_bbox_to_bboxq(feat["bbox"], scale=scale))
-
-        # geometry
-        geom = feat.get("geometry")
-        if not isinstance(geom, dict):
-            raise ValueError("Feature.geometry must be an object")
-        f.geometry.CopyFrom(_encode_polygon(geom, scale=scale))
-
-        fc.features.append(f)
-
-    return fc.SerializeToString()
+        _fill_bboxq(fc.bbox, obj["bbox"], scale=scale)
+
+    if workers is None or workers <= 1 or len(features) < 2 * workers:
+        _add_features(fc, features, scale)
+        return fc.SerializeToString()
+
+    # parallel: header (crs/bbox, fields 1-2) + per-chunk features (field 3) in order,
+    # byte-identical to the sequential encoding
+    size = -(-len(features) // workers)
+    chunks = [features[i:i + size] for i in range(0, len(features), size)]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(_encode_features_chunk, chunks, repeat(scale)))
+    return fc.SerializeToString() + b"".join(parts)
 
 
 def bytes_to_geojson_pand_featurecollection(data: bytes) -> GeoJSON:
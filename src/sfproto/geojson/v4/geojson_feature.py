@@ -9,15 +9,7 @@ from google.protobuf.json_format import MessageToDict
 from sfproto.sf.v4 import geometry_pb2
 
 # Reuse v1 geometry encoders/decoders (geometry bytes -> sf.v4.Geometry parses because schema matches)
-from sfproto.geojson.v1.geojson_point import geojson_point_to_bytes, bytes_to_geojson_point
-from sfproto.geojson.v1.geojson_polygon import geojson_polygon_to_bytes, bytes_to_geojson_polygon
-from sfproto.geojson.v1.geojson_multipolygon import geojson_multipolygon_to_bytes, bytes_to_geojson_multipolygon
-from sfproto.geojson.v1.geojson_multipoint import geojson_multipoint_to_bytes, bytes_to_geojson_multipoint
-from sfproto.geojson.v1.geojson_linestring import geojson_linestring_to_bytes, bytes_to_geojson_linestring
-from sfproto.geojson.v1.geojson_multilinestring import (
-    geojson_multilinestring_to_bytes,
-    bytes_to_geojson_multilinestring,
-)
+from sfproto.geojson.v1.geojson_geometry import GEOM_TO_BYTES, GEOM_BYTES_DECODERS
 
 GeoJSON = Dict[str, Any]
 GeoJSONInput = Union[GeoJSON, str]
@@ -52,21 +44,10 @@ def _extract_extra(obj: GeoJSON) -> Dict[str, Any]:
 
 def _encode_geometry_to_bytes(geometry: GeoJSON, srid: int) -> bytes:
     gtype = geometry.get("type")
-    # use correct function for the input type
-    if gtype == "Point":
-        return geojson_point_to_bytes(geometry, srid=srid)
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes(geometry, srid=srid)
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes(geometry, srid=srid)
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes(geometry, srid=srid)
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes(geometry, srid=srid)
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes(geometry, srid=srid)
-
-    raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    to_bytes = GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid)
 
 
 def geojson_feature_to_bytes_v4(obj_or_json: GeoJSONInput, srid: int = 0) -> bytes:
@@ -139,23 +120,11 @@ def bytes_to_geojson_feature_v4(data: bytes) -> GeoJSON:
     # Decode geometry by re-serializing embedded Geometry message and using existing decoders
     geom_bytes = feat.geometry.SerializeToString()
 
-    geometry: Optional[GeoJSON] = None
-    for decoder in (
-        bytes_to_geojson_point,
-        bytes_to_geojson_multipoint,
-        bytes_to_geojson_polygon,
-        bytes_to_geojson_multipolygon,
-        bytes_to_geojson_linestring,
-        bytes_to_geojson_multilinestring,
-    ):
-        try:
-            geometry = decoder(geom_bytes)
-            break
-        except Exception:
-            pass
-
-    if geometry is None:
+    # the set oneof case picks the one decoder that fits, instead of trying them all
+    decoder = GEOM_BYTES_DECODERS.get(feat.geometry.WhichOneof("geom"))
+    if decoder is None:
         raise ValueError("Feature.geometry contains an unsupported Geometry")
+    geometry = decoder(geom_bytes)
 
     props_dict = _struct_to_dict(feat.properties)
     properties = None if props_dict == {} else props_dict  # "empty struct == null" convention
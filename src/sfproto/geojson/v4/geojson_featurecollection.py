@@ -93,7 +93,8 @@ def geojson_featurecollection_to_bytes_v4(obj_or_json: GeoJSONInput, srid: int =
     # --- features ---
     for f in feats:
         feat_bytes = geojson_feature_to_bytes_v4(f, srid=srid)
-        fc.features.append(geometry_pb2.Feature.FromString(feat_bytes))
+        # parse straight into a new element of fc.features (no temporary Feature to copy)
+        fc.features.add().MergeFromString(feat_bytes)
 
     # --- bbox (optional) ---
     bbox = obj.get("bbox")
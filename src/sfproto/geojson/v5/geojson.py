@@ -1,16 +1,14 @@
 from __future__ import annotations
 
 import json
-import struct
-from typing import Any, Dict, List, Tuple, Union, Callable
+from typing import Any, Dict, Tuple, Union
 
+from google.protobuf.message import DecodeError
+
+from sfproto.sf.v2 import geometry_pb2
+from sfproto.geojson._chunks import pack_chunks, unpack_chunks
 # Reuse v2 geometry codecs (no attributes in pure geometries)
-from sfproto.geojson.v2.geojson_point import geojson_point_to_bytes_v2, bytes_to_geojson_point_v2
-from sfproto.geojson.v2.geojson_multipoint import geojson_multipoint_to_bytes_v2, bytes_to_geojson_multipoint_v2
-from sfproto.geojson.v2.geojson_linestring import geojson_linestring_to_bytes_v2, bytes_to_geojson_linestring_v2
-from sfproto.geojson.v2.geojson_multilinestring import geojson_multilinestring_to_bytes_v2, bytes_to_geojson_multilinestring_v2
-from sfproto.geojson.v2.geojson_polygon import geojson_polygon_to_bytes_v2, bytes_to_geojson_polygon_v2
-from sfproto.geojson.v2.geojson_multipolygon import geojson_multipolygon_to_bytes_v2, bytes_to_geojson_multipolygon_v2
+from sfproto.geojson.v2.geojson_geometry import GEOM_TO_BYTES, GEOM_DECODERS
 
 # v5 Feature codec (WITH properties)
 from sfproto.geojson.v5.geojson_feature import geojson_feature_to_bytes_v5, bytes_to_geojson_feature_v5
@@ -51,76 +49,24 @@ def _unwrap(data: bytes) -> Tuple[bytes, bytes]:
     return data[:_TAG_LEN], data[_TAG_LEN:]
 
 
-def _pack_chunks(chunks: List[bytes]) -> bytes:
-    out = bytearray()
-    out += struct.pack(">I", len(chunks))
-    for c in chunks:
-        out += struct.pack(">I", len(c))
-        out += c
-    return bytes(out)
-
-
-def _unpack_chunks(payload: bytes) -> List[bytes]:
-    mv = memoryview(payload)
-    if len(mv) < 4:
-        raise ValueError("Invalid chunk payload: too short")
-
-    (n,) = struct.unpack(">I", mv[:4])
-    offset = 4
-
-    chunks: List[bytes] = []
-    for _ in range(n):
-        if offset + 4 > len(mv):
-            raise ValueError("Invalid chunk payload: truncated length")
-        (ln,) = struct.unpack(">I", mv[offset:offset + 4])
-        offset += 4
-        if offset + ln > len(mv):
-            raise ValueError("Invalid chunk payload: truncated chunk")
-        chunks.append(bytes(mv[offset:offset + ln]))
-        offset += ln
-
-    if offset != len(mv):
-        raise ValueError("Invalid chunk payload: trailing bytes")
-    return chunks
-
-
 # -------------------- geometry dispatch (v2 geometry reused) --------------------
 def _geometry_to_bytes(geometry: GeoJSON, srid: int = 0, scale: int = DEFAULT_SCALE) -> bytes:
     gtype = geometry.get("type")
-    # use correct function for the input type (also with using scaling factor)
-    if gtype == "Point":
-        return geojson_point_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    raise ValueError(f"Unsupported GeoJSON geometry type: {gtype!r}")
-
-
-_GEOM_DECODERS: Tuple[Callable[[bytes], GeoJSON], ...] = (
-    bytes_to_geojson_point_v2,
-    bytes_to_geojson_multipoint_v2,
-    bytes_to_geojson_polygon_v2,
-    bytes_to_geojson_multipolygon_v2,
-    bytes_to_geojson_linestring_v2,
-    bytes_to_geojson_multilinestring_v2,
-)
+    to_bytes = GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        raise ValueError(f"Unsupported GeoJSON geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid, scale=scale)
 
 
 def _bytes_to_geometry(data: bytes) -> GeoJSON:
-    for dec in _GEOM_DECODERS:
-        try:
-            return dec(data)
-        except Exception:
-            pass
-    raise ValueError("Bytes do not contain a supported Geometry")
+    try:
+        g = geometry_pb2.Geometry.FromString(data)
+    except DecodeError as e:
+        raise ValueError("Bytes do not contain a supported Geometry") from e
+    dec = GEOM_DECODERS.get(g.WhichOneof("geom"))
+    if dec is None:
+        raise ValueError("Bytes do not contain a supported Geometry")
+    return dec(g)
 
 
 # -------------------- actually used functions v5 --------------------
@@ -138,12 +84,12 @@ def geojson_to_bytes_v5(obj_or_json: GeoJSONInput, srid: int = 0, scale: int = D
     # if Feature -> give feature tag + rest as chunks
     if t == "Feature":
         payload = geojson_feature_to_bytes_v5(obj, srid=srid, scale=scale)
-        return _wrap(_TAG_FEAT, _pack_chunks([payload]))
+        return _wrap(_TAG_FEAT, pack_chunks([payload]))
 
     # if FeatureCollection -> give featurecollection tag + rest as chunks
     if t == "FeatureCollection":
         payload = geojson_featurecollection_to_bytes_v5(obj, srid=srid, scale=scale)
-        return _wrap(_TAG_FCOL, _pack_chunks([payload]))
+        return _wrap(_TAG_FCOL, pack_chunks([payload]))
 
     # if GeometryCollection -> give geometrycollection tag + rest as chunks
     if t == "GeometryCollection":
@@ -152,11 +98,11 @@ def geojson_to_bytes_v5(obj_or_json: GeoJSONInput, srid: int = 0, scale: int = D
             raise ValueError("GeometryCollection.geometries must be a list")
 
         geom_bytes = [_geometry_to_bytes(g, srid=srid, scale=scale) for g in geoms]
-        return _wrap(_TAG_GCOL, _pack_chunks(geom_bytes))
+        return _wrap(_TAG_GCOL, pack_chunks(geom_bytes))
 
     # If input is not Feature, FeatureCollection or GeometryCollection, give 'geometry tag'
     payload = _geometry_to_bytes(obj, srid=srid, scale=scale)
-    return _wrap(_TAG_GEOM, _pack_chunks([payload]))
+    return _wrap(_TAG_GEOM, pack_chunks([payload]))
 
 
 def bytes_to_geojson_v5(data: bytes) -> GeoJSON:
@@ -166,7 +112,7 @@ def bytes_to_geojson_v5(data: bytes) -> GeoJSON:
 
     # get type from tag and input from payload of the encoded binary format
     tag, payload = _unwrap(data)
-    chunks = _unpack_chunks(payload)
+    chunks = unpack_chunks(payload)
 
     # use tag to find use the correct decoder formula
     if tag == _TAG_GEOM:
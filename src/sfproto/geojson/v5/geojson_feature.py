@@ -8,12 +8,7 @@ from google.protobuf.json_format import MessageToDict
 
 from sfproto.sf.v5 import geometry_pb2  # generated from your sf.v5 geometry.proto
 
-from sfproto.geojson.v2.geojson_point import geojson_point_to_bytes_v2, bytes_to_geojson_point_v2
-from sfproto.geojson.v2.geojson_polygon import geojson_polygon_to_bytes_v2, bytes_to_geojson_polygon_v2
-from sfproto.geojson.v2.geojson_multipolygon import geojson_multipolygon_to_bytes_v2, bytes_to_geojson_multipolygon_v2
-from sfproto.geojson.v2.geojson_multipoint import geojson_multipoint_to_bytes_v2, bytes_to_geojson_multipoint_v2
-from sfproto.geojson.v2.geojson_linestring import geojson_linestring_to_bytes_v2, bytes_to_geojson_linestring_v2
-from sfproto.geojson.v2.geojson_multilinestring import geojson_multilinestring_to_bytes_v2, bytes_to_geojson_multilinestring_v2
+from sfproto.geojson.v2.geojson_geometry import GEOM_TO_BYTES, GEOM_BYTES_DECODERS
 
 GeoJSON = Dict[str, Any]
 GeoJSONInput = Union[GeoJSON, str]
@@ -22,7 +17,6 @@ DEFAULT_SCALE = 1000  # 1e7 -> ~cm in EPSG:4326
 
 _RESERVED_TOPLEVEL = {"type", "geometry", "properties", "id", "bbox"}
 
-
 def _loads_if_needed(obj_or_json: GeoJSONInput) -> GeoJSON:
     return json.loads(obj_or_json) if isinstance(obj_or_json, str) else obj_or_json
 
@@ -44,20 +38,10 @@ def _extract_extra(obj: GeoJSON) -> Dict[str, Any]:
 def _encode_geometry_v2_bytes(geometry: GeoJSON, srid: int, scale: int) -> bytes:
     gtype = geometry.get("type")
 
-    if gtype == "Point":
-        return geojson_point_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "MultiPoint":
-        return geojson_multipoint_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "Polygon":
-        return geojson_polygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "MultiPolygon":
-        return geojson_multipolygon_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "LineString":
-        return geojson_linestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-    if gtype == "MultiLineString":
-        return geojson_multilinestring_to_bytes_v2(geometry, srid=srid, scale=scale)
-
-    raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    to_bytes = GEOM_TO_BYTES.get(gtype)
+    if to_bytes is None:
+        raise ValueError(f"Unsupported Feature geometry type: {gtype!r}")
+    return to_bytes(geometry, srid=srid, scale=scale)
 
 def geojson_feature_to_bytes_v5(
     obj_or_json: GeoJSONInput,
@@ -112,23 +96,11 @@ def bytes_to_geojson_feature_v5(data: bytes) -> GeoJSON:
     # v2 decoders can parse it because fields are identical.
     geom_bytes = feat.geometry.SerializeToString()
 
-    geometry: Optional[GeoJSON] = None
-    for decoder in (
-        bytes_to_geojson_point_v2,
-        bytes_to_geojson_multipoint_v2,
-        bytes_to_geojson_polygon_v2,
-        bytes_to_geojson_multipolygon_v2,
-        bytes_to_geojson_linestring_v2,
-        bytes_to_geojson_multilinestring_v2,
-    ):
-        try:
-            geometry = decoder(geom_bytes)
-            break
-        except Exception:
-            pass
-
-    if geometry is None:
+    # the set oneof case picks the one decoder that fits, instead of trying them all
+    decoder = GEOM_BYTES_DECODERS.get(feat.geometry.WhichOneof("geom"))
+    if decoder is None:
         raise ValueError("Feature.geometry contains an unsupported Geometry")
+    geometry = decoder(geom_bytes)
 
     props_dict = _struct_to_dict(feat.properties)
     properties = None if props_dict == {} else props_dict  # v4-style null convention
@@ -87,7 +87,8 @@ def geojson_featurecollection_to_bytes_v5(obj_or_json: GeoJSONInput, srid: int =
     # --- features ---
     for f in feats:
         feat_bytes = geojson_feature_to_bytes_v5(f, srid=srid, scale=scale)
-        fc.features.append(geometry_pb2.Feature.FromString(feat_bytes))
+        # parse straight into a new element of fc.features (no temporary Feature to copy)
+        fc.features.add().MergeFromString(feat_bytes)
 
     # --- bbox (optional) ---
     bbox = obj.get("bbox")
@@ -12,7 +12,7 @@ GeoJSONInput = Union[GeoJSON, str]
 # ------------------- quantization -------------------
 
 def _q(v: float, scale: int) -> int:
-    return int(round(float(v) * scale))
+    return round(float(v) * scale)
 
 
 def _uq(v: int, scale: int) -> float:
@@ -100,45 +100,53 @@ def _flatten_geometry(geom: GeoJSON) -> Tuple[int, List[Tuple[float, float]], Li
     raise ValueError(f"Unsupported geometry type: {t!r}")
 
 
-def _encode_stream_geometry(geom: GeoJSON, global_start_xy: Tuple[int, int], scale: int) -> geometry_pb2.StreamGeometry:
+def _fill_stream_geometry(pb: geometry_pb2.StreamGeometry, geom: GeoJSON, global_start_xy: Tuple[int, int], scale: int) -> None:
     gtype, flat_pts, part_sizes, poly_ring_counts = _flatten_geometry(geom)
 
     cursor_x, cursor_y = global_start_xy
 
-    pb = geometry_pb2.StreamGeometry()
     pb.type = int(gtype)
 
     if part_sizes:
-        pb.part_sizes.extend([int(x) for x in part_sizes])
+        pb.part_sizes.extend(part_sizes)
     if poly_ring_counts:
-        pb.poly_ring_counts.extend([int(x) for x in poly_ring_counts])
+        pb.poly_ring_counts.extend(poly_ring_counts)
 
     # packed dxy: [dx0, dy0, dx1, dy1, ...]
+    # quantized (_q inlined) into a plain list and handed to the packed sint32
+    # field in one extend, instead of two appends per point
+    sc = float(scale)
+    dxy: List[int] = []
+    append = dxy.append
     for (x, y) in flat_pts:
-        qx, qy = _q(x, scale), _q(y, scale)
-        dx = int(qx - cursor_x)
-        dy = int(qy - cursor_y)
-        pb.dxy.append(dx)
-        pb.dxy.append(dy)
+        qx = round(float(x) * sc)
+        qy = round(float(y) * sc)
+        append(qx - cursor_x)
+        append(qy - cursor_y)
         cursor_x, cursor_y = qx, qy
+    pb.dxy.extend(dxy)
 
+
+def _encode_stream_geometry(geom: GeoJSON, global_start_xy: Tuple[int, int], scale: int) -> geometry_pb2.StreamGeometry:
+    pb = geometry_pb2.StreamGeometry()
+    _fill_stream_geometry(pb, geom, global_start_xy, scale)
     return pb
 
 
 def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tuple[int, int], scale: int) -> GeoJSON:
     cursor_x, cursor_y = global_start_xy
-    qpts: List[Tuple[int, int]] = []
-
-    dxy = list(pb.dxy)
+    dxy = pb.dxy
     if len(dxy) % 2 != 0:
         raise ValueError("Invalid StreamGeometry: dxy length must be even")
 
-    for i in range(0, len(dxy), 2):
-        cursor_x += int(dxy[i])
-        cursor_y += int(dxy[i + 1])
-        qpts.append((cursor_x, cursor_y))
-
-    pts = [(_uq(x, scale), _uq(y, scale)) for (x, y) in qpts]
+    # dxy interleaves dx, dy: accumulate from the cursor and dequantize per point
+    s = float(scale)
+    pts: List[List[float]] = []
+    append = pts.append
+    for dx, dy in zip(dxy[0::2], dxy[1::2]):
+        cursor_x += dx
+        cursor_y += dy
+        append([cursor_x / s, cursor_y / s])
 
     t = int(pb.type)
     part_sizes = list(pb.part_sizes)
@@ -150,17 +158,16 @@ def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tu
         return {"type": "Point", "coordinates": [x, y]}
 
     if t == geometry_pb2.MULTIPOINT:
-        return {"type": "MultiPoint", "coordinates": [[x, y] for (x, y) in pts]}
+        return {"type": "MultiPoint", "coordinates": pts}
 
     if t == geometry_pb2.LINESTRING:
-        return {"type": "LineString", "coordinates": [[x, y] for (x, y) in pts]}
+        return {"type": "LineString", "coordinates": pts}
 
     if t == geometry_pb2.MULTILINESTRING:
         out_lines = []
         idx = 0
         for n in part_sizes:
-            seg = pts[idx: idx + n]
-            out_lines.append([[x, y] for (x, y) in seg])
+            out_lines.append(pts[idx: idx + n])
             idx += n
         return {"type": "MultiLineString", "coordinates": out_lines}
 
@@ -168,9 +175,8 @@ def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tu
         out_rings = []
         idx = 0
         for n in part_sizes:
-            ring = pts[idx: idx + n]
+            ring_coords = pts[idx: idx + n]
             idx += n
-            ring_coords = [[x, y] for (x, y) in ring]
             if ring_coords:
                 ring_coords.append(ring_coords[0])
             out_rings.append(ring_coords)
@@ -185,9 +191,8 @@ def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tu
             for _ in range(ring_count):
                 n = part_sizes[ring_size_idx]
                 ring_size_idx += 1
-                ring = pts[idx: idx + n]
+                ring_coords = pts[idx: idx + n]
                 idx += n
-                ring_coords = [[x, y] for (x, y) in ring]
                 if ring_coords:
                     ring_coords.append(ring_coords[0])
                 poly.append(ring_coords)
@@ -227,8 +232,8 @@ def geojson_featurecollection_to_bytes_v6(obj_or_json: GeoJSONInput, srid: int,
         geom = feat.get("geometry")
         if not isinstance(geom, dict):
             raise ValueError("Feature.geometry must be an object")
-        pb_geom = _encode_stream_geometry(geom, global_start_xy, scale)
-        fc.geometries.append(pb_geom)
+        # filled in place: appending a finished message would copy it
+        _fill_stream_geometry(fc.geometries.add(), geom, global_start_xy, scale)
 
     return fc.SerializeToString()
 
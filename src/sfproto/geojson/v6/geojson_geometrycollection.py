@@ -10,7 +10,7 @@ GeoJSONInput = Union[GeoJSON, str]
 
 from sfproto.geojson.v6.geojson_featurecollection import (
     _q, _uq, _first_coord_of_geometry,
-    _encode_stream_geometry, _decode_stream_geometry,
+    _fill_stream_geometry, _decode_stream_geometry,
 )
 
 
@@ -37,8 +37,7 @@ def geojson_geometrycollection_to_bytes_v6(obj_or_json: GeoJSONInput, srid: int,
     for g in geoms:
         if not isinstance(g, dict):
             raise ValueError("Each geometry must be an object")
-        pb_geom = _encode_stream_geometry(g, global_start_xy, scale)
-        gc.geometries.append(pb_geom)
+        _fill_stream_geometry(gc.geometries.add(), g, global_start_xy, scale)
 
     return gc.SerializeToString()
 
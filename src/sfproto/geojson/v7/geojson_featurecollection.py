@@ -35,7 +35,7 @@ def _extract_extra_fcol(obj: GeoJSON) -> Dict[str, Any]:
 
 # ---------- quantization helpers (same as you have) ----------
 def _q(v: float, scale: int) -> int:
-    return int(round(float(v) * scale))
+    return round(float(v) * scale)
 
 def _uq(v: int, scale: int) -> float:
     return float(v) / float(scale)
@@ -45,12 +45,12 @@ def _uq(v: int, scale: int) -> float:
 # _first_coord_of_geometry
 # _flatten_geometry
 
-def _encode_stream_geometry(geom: GeoJSON, global_start_xy: Tuple[int, int], scale: int) -> geometry_pb2.StreamGeometry:
+def _fill_stream_geometry(pb: geometry_pb2.StreamGeometry, geom: GeoJSON, global_start_xy: Tuple[int, int], scale: int) -> None:
+    # writes into pb in place (e.g. feat_pb.geometry), so no message is built and copied
     gtype, flat_pts, part_sizes, poly_ring_counts = _flatten_geometry(geom)
 
     cursor_x, cursor_y = global_start_xy
 
-    pb = geometry_pb2.StreamGeometry()
     pb.type = int(gtype)
 
     if part_sizes:
@@ -58,28 +58,32 @@ def _encode_stream_geometry(geom: GeoJSON, global_start_xy: Tuple[int, int], sca
     if poly_ring_counts:
         pb.poly_ring_counts.extend([int(x) for x in poly_ring_counts])
 
+    # _q inlined with float(scale) hoisted; the packed deltas go in with one extend
+    sc = float(scale)
+    dxy: List[int] = []
+    append = dxy.append
     for (x, y) in flat_pts:
-        qx, qy = _q(x, scale), _q(y, scale)
-        pb.dxy.append(int(qx - cursor_x))
-        pb.dxy.append(int(qy - cursor_y))
+        qx = round(float(x) * sc)
+        qy = round(float(y) * sc)
+        append(qx - cursor_x)
+        append(qy - cursor_y)
         cursor_x, cursor_y = qx, qy
-
-    return pb
+    pb.dxy.extend(dxy)
 
 
 def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tuple[int, int], scale: int) -> GeoJSON:
     cursor_x, cursor_y = global_start_xy
-    dxy = list(pb.dxy)
+    dxy = pb.dxy
     if len(dxy) % 2 != 0:
         raise ValueError("Invalid StreamGeometry: dxy length must be even")
 
-    qpts: List[Tuple[int, int]] = []
-    for i in range(0, len(dxy), 2):
-        cursor_x += int(dxy[i])
-        cursor_y += int(dxy[i + 1])
-        qpts.append((cursor_x, cursor_y))
-
-    pts = [(_uq(x, scale), _uq(y, scale)) for (x, y) in qpts]
+    s = float(scale)
+    pts: List[List[float]] = []
+    append = pts.append
+    for dx, dy in zip(dxy[0::2], dxy[1::2]):
+        cursor_x += dx
+        cursor_y += dy
+        append([cursor_x / s, cursor_y / s])
 
     t = int(pb.type)
     part_sizes = list(pb.part_sizes)
@@ -91,17 +95,16 @@ def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tu
         return {"type": "Point", "coordinates": [x, y]}
 
     if t == geometry_pb2.MULTIPOINT:
-        return {"type": "MultiPoint", "coordinates": [[x, y] for (x, y) in pts]}
+        return {"type": "MultiPoint", "coordinates": pts}
 
     if t == geometry_pb2.LINESTRING:
-        return {"type": "LineString", "coordinates": [[x, y] for (x, y) in pts]}
+        return {"type": "LineString", "coordinates": pts}
 
     if t == geometry_pb2.MULTILINESTRING:
         out_lines = []
         idx = 0
         for n in part_sizes:
-            seg = pts[idx: idx + n]
-            out_lines.append([[x, y] for (x, y) in seg])
+            out_lines.append(pts[idx: idx + n])
             idx += n
         return {"type": "MultiLineString", "coordinates": out_lines}
 
@@ -109,9 +112,8 @@ def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tu
         out_rings = []
         idx = 0
         for n in part_sizes:
-            ring = pts[idx: idx + n]
+            ring_coords = pts[idx: idx + n]
             idx += n
-            ring_coords = [[x, y] for (x, y) in ring]
             if ring_coords:
                 ring_coords.append(ring_coords[0])
             out_rings.append(ring_coords)
@@ -126,9 +128,8 @@ def _decode_stream_geometry(pb: geometry_pb2.StreamGeometry, global_start_xy: Tu
             for _ in range(ring_count):
                 n = part_sizes[ring_size_idx]
                 ring_size_idx += 1
-                ring = pts[idx: idx + n]
+                ring_coords = pts[idx: idx + n]
                 idx += n
-                ring_coords = [[x, y] for (x, y) in ring]
                 if ring_coords:
                     ring_coords.append(ring_coords[0])
                 poly.append(ring_coords)
@@ -172,8 +173,9 @@ def geojson_featurecollection_to_bytes_v7(obj_or_json: GeoJSONInput, srid: int,
         if not isinstance(geom, dict):
             raise ValueError("Feature.geometry must be an object (not null)")
 
-        feat_pb = geometry_pb2.Feature()
-        feat_pb.geometry.CopyFrom(_encode_stream_geometry(geom, global_start_xy, scale))
+        # build the feature in place in fc.features, geometry included
+        feat_pb = fc.features.add()
+        _fill_stream_geometry(feat_pb.geometry, geom, global_start_xy, scale)
 
         props = f.get("properties")
         if props is not None and not isinstance(props, dict):
@@ -194,8 +196,6 @@ def geojson_featurecollection_to_bytes_v7(obj_or_json: GeoJSONInput, srid: int,
         if extra:
             feat_pb.extra.CopyFrom(_dict_to_struct(extra))
 
-        fc.features.append(feat_pb)
-
     # collection bbox/name/extra (like v5)
     bbox = obj.get("bbox")
     if isinstance(bbox, list) and len(bbox) in (4, 6) and all(isinstance(x, (int, float)) for x in bbox):
@@ -10,7 +10,7 @@ from sfproto.sf.v7 import geometry_pb2
 
 from sfproto.geojson.v7.geojson_featurecollection import (
     _q, _uq, _first_coord_of_geometry,
-    _encode_stream_geometry, _decode_stream_geometry,
+    _fill_stream_geometry, _decode_stream_geometry,
 )
 
 GeoJSON = Dict[str, Any]
@@ -51,7 +51,7 @@ def geojson_geometrycollection_to_bytes_v7(obj_or_json: GeoJSONInput, srid: int,
     for g in geoms:
         if not isinstance(g, dict):
             raise ValueError("Each geometry must be an object")
-        gc.geometries.append(_encode_stream_geometry(g, global_start_xy, scale))
+        _fill_stream_geometry(gc.geometries.add(), g, global_start_xy, scale)
 
     bbox = obj.get("bbox")
     if isinstance(bbox, list) and len(bbox) in (4, 6) and all(isinstance(x, (int, float)) for x in bbox):
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14sf/v1/geometry.proto\x12\x05sf.v1\"\x13\n\x03\x43rs\x12\x0c\n\x04srid\x18\x01 \x01(\r\"\"\n\nCoordinate\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\")\n\x05Point\x12 \n\x05\x63oord\x18\x01 \x01(\x0b\x32\x11.sf.v1.Coordinate\"*\n\nMultiPoint\x12\x1c\n\x06points\x18\x01 \x03(\x0b\x32\x0c.sf.v1.Point\"*\n\nLineString\x12\x1c\n\x06points\x18\x01 \x03(\x0b\x32\x0c.sf.v1.Point\":\n\x0fMultiLineString\x12\'\n\x0cline_strings\x18\x01 \x03(\x0b\x32\x11.sf.v1.LineString\"/\n\nLinearRing\x12!\n\x06\x63oords\x18\x01 \x03(\x0b\x32\x11.sf.v1.Coordinate\"+\n\x07Polygon\x12 \n\x05rings\x18\x01 \x03(\x0b\x32\x11.sf.v1.LinearRing\"0\n\x0cMultiPolygon\x12 \n\x08polygons\x18\x01 \x03(\x0b\x32\x0e.sf.v1.Polygon\"\xa0\x02\n\x08Geometry\x12\x17\n\x03\x63rs\x18\x01 \x01(\x0b\x32\n.sf.v1.Crs\x12\x1d\n\x05point\x18\n \x01(\x0b\x32\x0c.sf.v1.PointH\x00\x12(\n\x0bline_string\x18\x0b \x01(\x0b\x32\x11.sf.v1.LineStringH\x00\x12!\n\x07polygon\x18\x0c \x01(\x0b\x32\x0e.sf.v1.PolygonH\x00\x12+\n\x0cmultipolygon\x18\r \x01(\x0b\x32\x13.sf.v1.MultiPolygonH\x00\x12\x31\n\x0fmultilinestring\x18\x0e \x01(\x0b\x32\x16.sf.v1.MultiLineStringH\x00\x12\'\n\nmultipoint\x18\x0f \x01(\x0b\x32\x11.sf.v1.MultiPointH\x00\x42\x06\n\x04geomb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14sf/v1/geometry.proto\x12\x05sf.v1\"\x13\n\x03\x43rs\x12\x0c\n\x04srid\x18\x01 \x01(\r\"\"\n\nCoordinate\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\")\n\x05Point\x12 \n\x05\x63oord\x18\x01 \x01(\x0b\x32\x11.sf.v1.Coordinate\"*\n\nMultiPoint\x12\x1c\n\x06points\x18\x01 \x03(\x0b\x32\x0c.sf.v1.Point\"*\n\nLineString\x12\x1c\n\x06points\x18\x01 \x03(\x0b\x32\x0c.sf.v1.Point\":\n\x0fMultiLineString\x12\'\n\x0cline_strings\x18\x01 \x03(\x0b\x32\x11.sf.v1.LineString\"/\n\nLinearRing\x12!\n\x06\x63oords\x18\x01 \x03(\x0b\x32\x11.sf.v1.Coordinate\"+\n\x07Polygon\x12 \n\x05rings\x18\x01 \x03(\x0b\x32\x11.sf.v1.LinearRing\"0\n\x0cMultiPolygon\x12 \n\x08polygons\x18\x01 \x03(\x0b\x32\x0e.sf.v1.Polygon\"\xd9\x02\n\x08Geometry\x12\x17\n\x03\x63rs\x18\x01 \x01(\x0b\x32\n.sf.v1.Crs\x12\x1d\n\x05point\x18\n \x01(\x0b\x32\x0c.sf.v1.PointH\x00\x12(\n\x0bline_string\x18\x0b \x01(\x0b\x32\x11.sf.v1.LineStringH\x00\x12!\n\x07polygon\x18\x0c \x01(\x0b\x32\x0e.sf.v1.PolygonH\x00\x12+\n\x0cmultipolygon\x18\r \x01(\x0b\x32\x13.sf.v1.MultiPolygonH\x00\x12\x31\n\x0fmultilinestring\x18\x0e \x01(\x0b\x32\x16.sf.v1.MultiLineStringH\x00\x12\'\n\nmultipoint\x18\x0f \x01(\x0b\x32\x11.sf.v1.MultiPointH\x00\x12\x37\n\x12geometrycollection\x18\x10 \x01(\x0b\x32\x19.sf.v1.GeometryCollectionH\x00\x42\x06\n\x04geom\"4\n\x12GeometryCollection\x12\x1e\n\x05geoms\x18\x01 \x03(\x0b\x32\x0f.sf.v1.Geometry\"L\n\x11\x46\x65\x61tureCollection\x12\x17\n\x03\x63rs\x18\x01 \x01(\x0b\x32\n.sf.v1.Crs\x12\x1e\n\x05geoms\x18\x02 \x03(\x0b\x32\x0f.sf.v1.Geometryb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -50,5 +50,9 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_MULTIPOLYGON']._serialized_start=373
   _globals['_MULTIPOLYGON']._serialized_end=421
   _globals['_GEOMETRY']._serialized_start=424
-  _globals['_GEOMETRY']._serialized_end=712
+  _globals['_GEOMETRY']._serialized_end=769
+  _globals['_GEOMETRYCOLLECTION']._serialized_start=771
+  _globals['_GEOMETRYCOLLECTION']._serialized_end=823
+  _globals['_FEATURECOLLECTION']._serialized_start=825
+  _globals['_FEATURECOLLECTION']._serialized_end=901
 # @@protoc_insertion_point(module_scope)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import orjson
 from pathlib import Path
 from typing import Any, Dict, Union
 
+from sfproto._io import parse_mapped
+
 # =========================
 # Import your BAG Pand v1 converters
 # =========================
@@ -17,6 +19,19 @@ from sfproto.geojson.v3_BAG.geojson_bag import (
 GeoJSON = Dict[str, Any]
 
 
+def load_geojson(path: Path) -> GeoJSON:
+    """
+    Parse a GeoJSON file straight from a read-only memory map, so large BAG
+    files are not first copied into a bytes object.
+    Falls back to a plain read for files that cannot be mapped (e.g. empty files).
+
+    No parsed-data cache on purpose: orjson is already bound by building the
+    Python dict/list tree, so reloading a marshal/pickle/Arrow copy of the
+    features is not faster than parsing the JSON again.
+    """
+    return parse_mapped(path, orjson.loads)
+
+
 def roundtrip_bag_pand_geojson(
     input_geojson: Union[str, Path, GeoJSON],
     out_dir: Union[str, Path] = "roundtrip_out",
@@ -37,7 +52,7 @@ def roundtrip_bag_pand_geojson(
     if isinstance(input_geojson, (str, Path)):
         input_path = Path(input_geojson)
         print(f"Reading GeoJSON: {input_path}")
-        geojson_obj = json.loads(input_path.read_text(encoding="utf-8"))
+        geojson_obj = load_geojson(input_path)
         base_name = input_path.stem
     else:
         geojson_obj = input_geojson
@@ -67,9 +82,8 @@ def roundtrip_bag_pand_geojson(
     decoded_geojson = bytes_to_geojson_pand_featurecollection(pb_bytes)
 
     decoded_path = out_dir / f"{base_name}_roundtrip.geojson"
-    decoded_path.write_text(
-        json.dumps(decoded_geojson, indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    decoded_path.write_bytes(
+        orjson.dumps(decoded_geojson, option=orjson.OPT_INDENT_2),
     )
 
     print(f"Wrote round-tripped GeoJSON: {decoded_path}")
@@ -1,4 +1,5 @@
-import json
+import orjson
+from sfproto._io import write_stdout
 from sfproto.geojson.v1.geojson import geojson_to_bytes, bytes_to_geojson
 from sfproto.geojson.v2.geojson import geojson_to_bytes_v2, bytes_to_geojson_v2
 from sfproto.geojson.v4.geojson import geojson_to_bytes_v4, bytes_to_geojson_v4
@@ -6,6 +7,7 @@ from sfproto.geojson.v5.geojson import geojson_to_bytes_v5, bytes_to_geojson_v5
 from sfproto.geojson.v6.geojson import geojson_to_bytes_v6, bytes_to_geojson_v6
 from sfproto.geojson.v7.geojson import geojson_to_bytes_v7, bytes_to_geojson_v7
 
+from functools import cache, partial
 from pathlib import Path
 from pyproj import CRS
 
@@ -16,26 +18,31 @@ GeoJSON = Dict[str, Any]
 DEFAULT_SRID = 4326
 
 # function to load the geojson from the file
+# (cached per path: re-running cells in a notebook or looping over _INPUT_FILES does not
+#  re-read and re-parse a file; callers must treat the returned dict as read-only)
+@cache
 def load_geojson(relative_path):
     base_dir = Path(__file__).parent   # examples/
     path = base_dir / relative_path    # examples/data/Point.geojson
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 # =================================== DATA ==========================================
-geojson_point = load_geojson('data/Point.geojson')
-geojson_linestring = load_geojson('data/Linestring.geojson')
-geojson_polygon = load_geojson('data/Polygon_with_holes.geojson')
-geojson_multipoint = load_geojson('data/MultiPoint.geojson')
-geojson_multilinestring = load_geojson('data/MultiLineString.geojson')
-geojson_multipolygon = load_geojson('data/MultiPolygon.geojson')
-geojson_geometrycollection = load_geojson('data/GeometryCollection.geojson')
-geojson_feature = load_geojson('data/Feature.geojson')
-geojson_featurecollection = load_geojson('data/FeatureCollection.geojson')
-geojson_BAG = load_geojson('data/bag_pand_count_10.geojson')
-
-
-_geojson_input = geojson_BAG
+# one table of example inputs; only the selected one is read and parsed
+_INPUT_FILES = {
+    "point": 'data/Point.geojson',
+    "linestring": 'data/Linestring.geojson',
+    "polygon": 'data/Polygon_with_holes.geojson',
+    "multipoint": 'data/MultiPoint.geojson',
+    "multilinestring": 'data/MultiLineString.geojson',
+    "multipolygon": 'data/MultiPolygon.geojson',
+    "geometrycollection": 'data/GeometryCollection.geojson',
+    "feature": 'data/Feature.geojson',
+    "featurecollection": 'data/FeatureCollection.geojson',
+    "BAG": 'data/bag_pand_count_10.geojson',
+}
+
+
+_geojson_input = load_geojson(_INPUT_FILES["BAG"])
 _version = 5
 
 # function to extract the geojson, if no geojson is present, then use default srid = 4326
@@ -45,8 +52,7 @@ def extract_srid_from_geojson(obj: Union[GeoJSON, str]) -> int:
     Returns DEFAULT_SRID (4326) if no CRS is present or parsable.
     """
     if isinstance(obj, str):
-        import json
-        obj = json.loads(obj)
+        obj = orjson.loads(obj)
 
     # CRS may appear at FeatureCollection or Feature level
     crs_obj = obj.get("crs")
@@ -103,43 +109,60 @@ def get_scaler(srid:int) -> int:
 _default_scaler = get_scaler(_srid)
 print(f'default scaler: {_default_scaler}')
 
+# compact json bytes of the input, serialized once here: every roundtrip() call reports
+# its length and the input is printed again at the end
+_geojson_input_bytes = orjson.dumps(_geojson_input)
+
 # ================================ ROUND TRIP ======================================
 # geojson -> encode -> binary -> decode -> geojson
 # different versions where made, the delta encoded ones need the earlier extracted default scaler
-def roundtrip(input_geojson, version, print_):
-    data_length = json.dumps(input_geojson, separators=(",", ":")).encode("utf-8")
-    print(f'data length: = {len(data_length)}')
-    if version == 1:
-        binary_representation = geojson_to_bytes(input_geojson, srid=_srid)
-        to_geojson = bytes_to_geojson(binary_representation)
-    elif version == 2:
-        binary_representation = geojson_to_bytes_v2(input_geojson, srid=_srid, scale=_default_scaler)
-        to_geojson = bytes_to_geojson_v2(binary_representation)
-    elif version == 4:
-        binary_representation = geojson_to_bytes_v4(input_geojson, srid=_srid)
-        to_geojson = bytes_to_geojson_v4(binary_representation)
-    elif version == 5:
-        binary_representation = geojson_to_bytes_v5(input_geojson, srid=_srid, scale=_default_scaler)
-        to_geojson = bytes_to_geojson_v5(binary_representation)
-    elif version == 6:
-        binary_representation = geojson_to_bytes_v6(input_geojson, srid=_srid, scale=_default_scaler)
-        to_geojson = bytes_to_geojson_v6(binary_representation)
-    elif version == 7:
-        binary_representation = geojson_to_bytes_v7(input_geojson, srid=_srid, scale=_default_scaler)
-        to_geojson = bytes_to_geojson_v7(binary_representation)
-    else:
+
+# report of one roundtrip, formatted once and written together with the output json
+_REPORT = (
+    'data length: = {data_len}\n'
+    'protobuf v{version} bytes length: {pb_len} vs fair geojson byte length: {fair_len}\n'
+)
+
+# version -> (encoder, decoder). srid and scale are fixed once they are extracted above,
+# so the encoders are specialised with functools.partial here instead of per call
+_CODECS = {
+    1: (partial(geojson_to_bytes, srid=_srid), bytes_to_geojson),
+    2: (partial(geojson_to_bytes_v2, srid=_srid, scale=_default_scaler), bytes_to_geojson_v2),
+    4: (partial(geojson_to_bytes_v4, srid=_srid), bytes_to_geojson_v4),
+    5: (partial(geojson_to_bytes_v5, srid=_srid, scale=_default_scaler), bytes_to_geojson_v5),
+    6: (partial(geojson_to_bytes_v6, srid=_srid, scale=_default_scaler), bytes_to_geojson_v6),
+    7: (partial(geojson_to_bytes_v7, srid=_srid, scale=_default_scaler), bytes_to_geojson_v7),
+}
+
+def roundtrip(input_geojson, version, print_, input_bytes=None):
+    data_length = input_bytes if input_bytes is not None else orjson.dumps(input_geojson)
+    codec = _CODECS.get(version)
+    if codec is None:
+        print(f'data length: = {len(data_length)}')
         print(f'version = {version} does not exist')
         return
-    # remove whitespaces in json when comparing byte length by using "," and ":" instead of ", " and ": "
-    geojson_bytes_fair = json.dumps(to_geojson, separators=(",", ":")).encode("utf-8")
-    print(f'protobuf v{version} bytes length: {len(binary_representation)} vs fair geojson byte length: {len(geojson_bytes_fair)}')
+    encode, decode = codec
+    binary_representation = encode(input_geojson)
+    to_geojson = decode(binary_representation)
+    # orjson output is already compact (no whitespace after "," and ":") utf-8 bytes
+    geojson_bytes_fair = orjson.dumps(to_geojson)
+    report = _REPORT.format(
+        data_len=len(data_length),
+        version=version,
+        pb_len=len(binary_representation),
+        fair_len=len(geojson_bytes_fair),
+    ).encode()
     if print_:
-        print(f'output geojson after roundtrip: {to_geojson}')
+        # the fair-length bytes already are the serialized output: append them as-is
+        # (no second orjson.dumps and no str copy of the payload)
+        report = b''.join((report, b'output geojson after roundtrip: ', geojson_bytes_fair, b'\n'))
+    # the whole report goes out as one blob in a single write
+    write_stdout(report)
 
 # roundtrip a geojson input and compare byte length and optionally output json file again
-roundtrip(_geojson_input, 4, True)
-print(f'output geojson before roundtrip: {_geojson_input}')
-# roundtrip(_geojson_input, 2, False)
-# roundtrip(_geojson_input, 6, False)
-# roundtrip(_geojson_input, _version, False)
-# roundtrip(_geojson_input, 7, False)
+roundtrip(_geojson_input, 4, True, _geojson_input_bytes)
+print(f'output geojson before roundtrip: {_geojson_input_bytes.decode()}')
+# roundtrip(_geojson_input, 2, False, _geojson_input_bytes)
+# roundtrip(_geojson_input, 6, False, _geojson_input_bytes)
+# roundtrip(_geojson_input, _version, False, _geojson_input_bytes)
+# roundtrip(_geojson_input, 7, False, _geojson_input_bytes)
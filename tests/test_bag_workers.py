@@ -0,0 +1,44 @@
+import pytest
+
+from sfproto.geojson.v3_BAG.geojson_bag import (
+    geojson_pand_featurecollection_to_bytes,
+    bytes_to_geojson_pand_featurecollection,
+)
+
+STATUSES = ["Pand in gebruik", "Verbouwing pand", "Bouw gestart"]
+GEBRUIKSDOELEN = ["woonfunctie", "kantoorfunctie", "winkelfunctie"]
+
+
+def _pand(i: int):
+    x = 96000.0 + 25.5 * i
+    y = 469000.0 + 12.25 * i
+    ring = [[x, y], [x + 10.0, y], [x + 10.0, y + 8.5], [x, y + 8.5], [x, y]]
+    return {
+        "type": "Feature",
+        "id": f"pand.{i:08x}-8d88-348a-7eed-8d14f06d3fef",
+        "properties": {
+            "identificatie": f"{992184428663000 + i:016d}",
+            "rdf_seealso": f"http://bag.basisregistraties.overheid.nl/bag/id/pand/{992184428663000 + i:016d}",
+            "bouwjaar": 1900 + i,
+            "status": STATUSES[i % len(STATUSES)],
+            "gebruiksdoel": GEBRUIKSDOELEN[i % len(GEBRUIKSDOELEN)],
+            "aantal_verblijfsobjecten": i % 4,
+        },
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+        "bbox": [x, y, x + 10.0, y + 8.5],
+    }
+
+
+FC = {
+    "type": "FeatureCollection",
+    "bbox": [96000.0, 469000.0, 96500.0, 469300.0],
+    "features": [_pand(i) for i in range(13)],
+}
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_workers_match_sequential_bytes(workers):
+    sequential = geojson_pand_featurecollection_to_bytes(FC)
+    parallel = geojson_pand_featurecollection_to_bytes(FC, workers=workers)
+    assert parallel == sequential
+    assert bytes_to_geojson_pand_featurecollection(parallel)["features"]
@@ -0,0 +1,79 @@
+from sfproto.sf.v1 import geometry_pb2
+from sfproto.geojson.v1.geojson_point import geojson_point_to_bytes
+from sfproto.geojson.v1.geojson_multipoint import geojson_multipoint_to_bytes
+from sfproto.geojson.v1.geojson_linestring import geojson_linestring_to_bytes
+from sfproto.geojson.v1.geojson_multilinestring import geojson_multilinestring_to_bytes
+from sfproto.geojson.v1.geojson_polygon import geojson_polygon_to_bytes
+from sfproto.geojson.v1.geojson_multipolygon import geojson_multipolygon_to_bytes
+from sfproto.geojson.v1.geojson_geometrycollection import geojson_geometrycollection_to_bytes
+from sfproto.geojson.v1.geojson_featurecollection import (
+    geojson_featurecollection_to_bytes,
+    bytes_to_geojson_featurecollection,
+)
+
+RING = [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]]
+HOLE = [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 1.0]]
+
+GEOMETRIES = [
+    {"type": "Point", "coordinates": [5.1, 52.3]},
+    {"type": "MultiPoint", "coordinates": [[5.1, 52.3], [5.2, 52.4]]},
+    {"type": "LineString", "coordinates": [[0.5, 1.5], [2.25, 3.75], [4.0, 5.0]]},
+    {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 1.0]], [[2.0, 2.0], [3.0, 3.5]]]},
+    {"type": "Polygon", "coordinates": [RING, HOLE]},
+    {"type": "MultiPolygon", "coordinates": [[RING], [RING, HOLE]]},
+    {
+        "type": "GeometryCollection",
+        "geometries": [
+            {"type": "Point", "coordinates": [1.0, 2.0]},
+            {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+            {"type": "Polygon", "coordinates": [RING]},
+        ],
+    },
+]
+
+# per-geometry encoders of the list-based v1 FeatureCollection
+BASELINE_TO_BYTES = {
+    "Point": geojson_point_to_bytes,
+    "MultiPoint": geojson_multipoint_to_bytes,
+    "LineString": geojson_linestring_to_bytes,
+    "MultiLineString": geojson_multilinestring_to_bytes,
+    "Polygon": geojson_polygon_to_bytes,
+    "MultiPolygon": geojson_multipolygon_to_bytes,
+}
+
+FC = {
+    "type": "FeatureCollection",
+    "features": [{"type": "Feature", "geometry": g, "properties": None} for g in GEOMETRIES],
+}
+
+
+def _without_crs(data: bytes) -> bytes:
+    g = geometry_pb2.Geometry.FromString(data)
+    g.ClearField("crs")
+    return g.SerializeToString()
+
+
+def test_roundtrip_all_geometry_types():
+    assert bytes_to_geojson_featurecollection(geojson_featurecollection_to_bytes(FC)) == FC
+
+
+def test_geometries_match_baseline_encoder():
+    fc = geometry_pb2.FeatureCollection.FromString(
+        geojson_featurecollection_to_bytes(FC, srid=4326)
+    )
+    assert fc.crs.srid == 4326
+    assert len(fc.geoms) == len(GEOMETRIES)
+
+    for geometry, pb in zip(GEOMETRIES, fc.geoms):
+        # the crs is stored once on the collection, never per geometry
+        assert not pb.HasField("crs")
+
+        if geometry["type"] == "GeometryCollection":
+            members = geojson_geometrycollection_to_bytes(geometry)
+            assert [m.SerializeToString() for m in pb.geometrycollection.geoms] == [
+                _without_crs(m) for m in members
+            ]
+            assert all(not m.HasField("crs") for m in pb.geometrycollection.geoms)
+        else:
+            baseline = BASELINE_TO_BYTES[geometry["type"]](geometry)
+            assert pb.SerializeToString() == _without_crs(baseline)